@@ -1,35 +1,255 @@
 #!/usr/bin/env python3
 
 # Standard Library
+import os
 import re
-import html
 import json
 import time
 import random
+import sqlite3
 from typing import Optional
 from typing import Tuple
 import argparse
+import functools
+import threading
 import urllib.parse
-import urllib.request
+import collections
+import concurrent.futures
 
 # PIP3 modules
 import mutagen
+import requests
+import requests.adapters
 import mutagen.mp3
 import mutagen.flac
+import lxml.html
+import lxml.etree
 from rich import print
 from rich.markup import escape
 
 # Local repo modules
+import disk_cache
+import audio_utils
 from cli_colors import Colors
 
+UNKNOWN_TITLE = "Unknown Title"
+UNKNOWN_ARTIST = "Unknown Artist"
+UNKNOWN_ALBUM = "Unknown Album"
+# placeholder summary when every service came back empty
+NO_SUMMARY_TEXT = "No Wikipedia, Last.fm, or AllMusic summary available."
+
+_CHICAGO_SUBURBS = (
+	"Naperville", "Evanston", "Schaumburg", "Oak Park", "Arlington Heights",
+	"Aurora", "Skokie", "Elmhurst", "Downers Grove", "Wheaton",
+	"Palatine", "Glenview", "Bolingbrook", "Orland Park", "Des Plaines",
+)
+
+HTTP_TIMEOUT_SECONDS = 5
+BATCH_MAX_WORKERS = 8
+# Upper bound on HTTP requests in flight across all lookup threads
+MAX_CONCURRENT_REQUESTS = 8
+# Wikipedia etiquette: about 10 API requests per second, with short bursts allowed
+WIKIPEDIA_REQUESTS_PER_SECOND = 10
+WIKIPEDIA_BURST = 5
+
+_FEAT_RE = re.compile(r"\(feat.*?\)", re.IGNORECASE)
+_OG_DESC_XPATH = lxml.etree.XPath('//meta[@property="og:description"]/@content')
+_META_DESC_XPATH = lxml.etree.XPath('//meta[@name="description"]/@content')
+_HREF_XPATH = lxml.etree.XPath("//a/@href")
+
+#============================================
+class _TitleCharFilter(dict):
+	"""
+	str.translate table that keeps ASCII letters, digits, and whitespace.
+	Non-ASCII code points are resolved on first sight and remembered.
+	"""
+	def __missing__(self, codepoint: int):
+		keep = codepoint if chr(codepoint).isspace() else None
+		self[codepoint] = keep
+		return keep
+
+_TITLE_CHARS = _TitleCharFilter(
+	(code, code if chr(code).isalnum() or chr(code).isspace() else None) for code in range(128)
+)
+
+# One pooled session shared by every lookup keeps TLS connections alive
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+# Wikimedia asks API clients for a descriptive User-Agent instead of a browser string
+WIKIPEDIA_HEADERS = {
+	"User-Agent": "automated_radio_disc_jockey/1.0 (https://github.com/vosslab/automated_radio_disc_jockey)",
+}
+
+# In-process LRU memo of lookup results, keyed by (service, query args).
+# Wikipedia searches that found no page are memoized too; failed requests are not.
+MAX_LOOKUP_CACHE_ENTRIES = 512
+_LOOKUP_CACHE = collections.OrderedDict()
+_LOOKUP_CACHE_LOCK = threading.Lock()
+_MISSING = object()
+_HTTP_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+_WIKI_RATE_LOCK = threading.Lock()
+# token bucket state; a negative balance holds reservations of sleeping threads
+_wiki_tokens = float(WIKIPEDIA_BURST)
+_wiki_tokens_updated = 0.0
+
+#============================================
+def _memo_get(cache_key: tuple):
+	"""
+	Return a memoized lookup result, or _MISSING, and mark it recently used.
+	"""
+	with _LOOKUP_CACHE_LOCK:
+		value = _LOOKUP_CACHE.get(cache_key, _MISSING)
+		if value is not _MISSING:
+			_LOOKUP_CACHE.move_to_end(cache_key)
+		return value
+
+#============================================
+def _memo_put(cache_key: tuple, value) -> None:
+	"""
+	Memoize a lookup result, dropping the least recently used past the cap.
+	"""
+	with _LOOKUP_CACHE_LOCK:
+		_LOOKUP_CACHE[cache_key] = value
+		_LOOKUP_CACHE.move_to_end(cache_key)
+		while len(_LOOKUP_CACHE) > MAX_LOOKUP_CACHE_ENTRIES:
+			_LOOKUP_CACHE.popitem(last=False)
+
+#============================================
+def _wait_for_wikipedia_slot() -> None:
+	"""
+	Takes one token from the shared Wikipedia token bucket, sleeping only
+	when the burst is spent. The sleep happens outside the lock, so waiting
+	threads hold evenly spaced reservations instead of queueing on the lock.
+	"""
+	global _wiki_tokens, _wiki_tokens_updated
+	with _WIKI_RATE_LOCK:
+		now = time.monotonic()
+		refill = (now - _wiki_tokens_updated) * WIKIPEDIA_REQUESTS_PER_SECOND
+		_wiki_tokens = min(float(WIKIPEDIA_BURST), _wiki_tokens + refill)
+		_wiki_tokens_updated = now
+		_wiki_tokens -= 1
+		wait_seconds = -_wiki_tokens / WIKIPEDIA_REQUESTS_PER_SECOND
+	if wait_seconds > 0:
+		time.sleep(wait_seconds)
+
+#============================================
+def _read_until_marker(resp: requests.Response, stop_marker: bytes) -> bytes:
+	"""
+	Reads a streamed response until stop_marker (lowercase) appears,
+	matching case-insensitively, and returns the bytes read so far.
+	"""
+	chunks = []
+	tail = b""
+	for chunk in resp.iter_content(chunk_size=4096):
+		chunks.append(chunk)
+		# keep a short tail so a marker split across chunks still matches
+		window = tail + chunk.lower()
+		if stop_marker in window:
+			break
+		tail = window[-len(stop_marker):]
+	return b"".join(chunks)
+
+#============================================
+def _cached_get(
+	endpoint: str,
+	url: str,
+	params: dict | None = None,
+	rate_limited: bool = False,
+	stop_marker: bytes | None = None,
+	headers: dict | None = None,
+) -> bytes | None:
+	"""
+	Returns the raw response body for a GET request, reading through the disk cache.
+
+	Only successful responses are cached. rate_limited applies the Wikipedia
+	rate limiter before a real network request (never on a cache hit).
+	stop_marker stops reading the page once it is seen, e.g. b"</head>" when
+	only meta tags are needed. Bodies stay bytes so JSON is parsed without
+	an intermediate decode. headers override the session defaults for this request.
+	"""
+	query = url
+	if params:
+		query += "?" + urllib.parse.urlencode(params)
+	body = disk_cache.get_response(endpoint, query)
+	if body is not None:
+		return body
+	# Batch runs nest entity and fallback pools, so cap the total fan-out
+	with _HTTP_SLOTS:
+		if rate_limited:
+			_wait_for_wikipedia_slot()
+		with HTTP_SESSION.get(
+			url, params=params, headers=headers, timeout=HTTP_TIMEOUT_SECONDS, stream=True
+		) as resp:
+			if resp.status_code != 200:
+				return None
+			if stop_marker is None:
+				body = resp.content
+			else:
+				body = _read_until_marker(resp, stop_marker)
+	disk_cache.store_response(endpoint, query, body)
+	return body
+
+#============================================
+def _page_summary(page: dict) -> tuple | None:
+	"""
+	Returns (title, url, extract) for a MediaWiki query page, or None when
+	the page is missing, has no extract, or is a disambiguation page.
+	"""
+	if "disambiguation" in page.get("pageprops", {}):
+		return None
+	extract = page.get("extract")
+	if not extract:
+		return None
+	page_title = page.get("title", "")
+	page_url = page.get("fullurl")
+	if not page_url:
+		slug = urllib.parse.quote(page_title.replace(" ", "_"))
+		page_url = f"https://en.wikipedia.org/wiki/{slug}"
+	return page_title, page_url, extract
+
+#============================================
+def _first_meta_content(html_body: bytes, xpaths: tuple) -> str | None:
+	"""
+	Parses an HTML page and returns the first non-empty meta content
+	matched by the compiled xpaths, in order.
+	"""
+	if not html_body.strip():
+		return None
+	tree = lxml.html.fromstring(html_body.decode("utf-8", errors="ignore"))
+	for xpath in xpaths:
+		for content in xpath(tree):
+			desc = content.strip().replace("\n", " ")
+			if desc:
+				return desc
+	return None
+
+#============================================
+@functools.lru_cache(maxsize=4096)
+def _clean_summary(summary: str) -> str:
+	"""Turns each paragraph of a summary into a '* ' bullet line."""
+	return "* " + summary.strip().replace("\n", "\n* ")
+
 #============================================
+@functools.lru_cache(maxsize=4096)
+def _clean_title(title: str) -> str:
+	"""Cleans the song title by removing unnecessary text like (feat. ...) or special characters."""
+	title = _FEAT_RE.sub("", title)
+	title = title.translate(_TITLE_CHARS)  # Remove special characters
+	return title.strip()
+
 #============================================
 class Metadata:
 	"""
 	Represents metadata extracted from an audio file.
 	Handles Wikipedia lookups for artist, album, and song.
 	"""
-	#============================================
+	__slots__ = (
+		"filename", "debug", "title", "artist", "album", "is_compilation",
+		"artist_summary", "artist_url", "album_summary", "album_url", "song_summary", "song_url",
+		"_search_title", "_artist_slug", "_album_slug", "_title_slug",
+	)
+
 	#============================================
 	def __init__(self, filename: str, debug: bool = False):
 		"""
@@ -38,9 +258,9 @@ class Metadata:
 		self.filename = filename
 		self.debug = debug
 
-		self.title = "Unknown Title"
-		self.artist = "Unknown Artist"
-		self.album = "Unknown Album"
+		self.title = UNKNOWN_TITLE
+		self.artist = UNKNOWN_ARTIST
+		self.album = UNKNOWN_ALBUM
 		self.is_compilation = True
 
 		self.artist_summary = None
@@ -52,6 +272,18 @@ class Metadata:
 
 		# Extract metadata when initialized
 		self.extract_metadata()
+		self._build_query_slugs()
+
+	#============================================
+	def _build_query_slugs(self):
+		"""
+		Cleans and percent-encodes the tag fields once so every lookup
+		and cache key uses the same strings.
+		"""
+		self._search_title = _clean_title(self.title)
+		self._artist_slug = urllib.parse.quote(self.artist)
+		self._album_slug = urllib.parse.quote(self.album)
+		self._title_slug = urllib.parse.quote(self._search_title)
 
 	#============================================
 	def __str__(self) -> str:
@@ -72,14 +304,15 @@ class Metadata:
 		Extracts metadata from an MP3 or FLAC file and updates instance attributes.
 		Tries to be resilient to missing tags.
 		"""
-		if self.filename.lower().endswith(".mp3"):
-			audio = mutagen.mp3.MP3(self.filename, ID3=mutagen.easyid3.EasyID3)
+		extension = os.path.splitext(self.filename)[1].lower()
+		if extension == ".mp3":
+			audio = mutagen.mp3.MP3(self.filename, ID3=audio_utils.TagOnlyEasyID3)
 			self.title = (audio.get('title') or [self.title])[0]
 			self.artist = (audio.get('artist') or [self.artist])[0]
 			self.album = (audio.get('album') or [self.album])[0]
 			self.is_compilation = (audio.get('TCMP') or ['0'])[0] == '1'
 
-		elif self.filename.lower().endswith(".flac"):
+		elif extension == ".flac":
 			audio = mutagen.flac.FLAC(self.filename)
 			self.title = (audio.get('title') or [self.title])[0]
 			self.artist = (audio.get('artist') or [self.artist])[0]
@@ -89,41 +322,31 @@ class Metadata:
 			raise ValueError("Unsupported file format. Only MP3 and FLAC are supported.")
 
 	#============================================
-	def _clean_summary(self, summary):
-		summary = summary.strip()
-		paragraphs = summary.split("\n")
-		summary = '* ' + '\n* '.join(paragraphs)
-		return summary.strip()
-
-	#============================================
-	def _fetch_lastfm_wiki(self, artist: str, title: str, kind: str) -> Tuple[Optional[str], Optional[str]]:
+	def _fetch_lastfm_wiki(self, kind: str) -> Tuple[Optional[str], Optional[str]]:
 		"""
 		Attempts to fetch a short description from Last.fm wiki pages.
 		kind is one of: song, album, artist
 		"""
+		if kind == "song":
+			url = f"https://www.last.fm/music/{self._artist_slug}/{self._title_slug}/+wiki"
+		elif kind == "album":
+			url = f"https://www.last.fm/music/{self._artist_slug}/{self._album_slug}/+wiki"
+		else:  # artist
+			url = f"https://www.last.fm/music/{self._artist_slug}/+wiki"
+		cache_key = ("lastfm", url)
+		cached = _memo_get(cache_key)
+		if cached is not _MISSING:
+			return cached
 		try:
-			artist_slug = urllib.parse.quote(artist)
-			title_slug = urllib.parse.quote(title)
-
-			if kind == "song":
-				url = f"https://www.last.fm/music/{artist_slug}/{title_slug}/+wiki"
-			elif kind == "album":
-				url = f"https://www.last.fm/music/{artist_slug}/{title_slug}/+wiki"
-			else:  # artist
-				url = f"https://www.last.fm/music/{artist_slug}/+wiki"
-
-			with urllib.request.urlopen(url, timeout=5) as resp:
-				if resp.status != 200:
-					return None, None
-				html_text = resp.read().decode("utf-8", errors="ignore")
+			html_body = _cached_get("lastfm", url, stop_marker=b"</head>")
+			if html_body is None:
+				return None, None
 
 			# Grab the OpenGraph description if present
-			match = re.search(r'<meta property="og:description" content="(.*?)"', html_text, flags=re.IGNORECASE)
-			if match:
-				desc = html.unescape(match.group(1)).strip()
-				desc = desc.replace("\n", " ")
-				if desc:
-					return url, desc
+			desc = _first_meta_content(html_body, (_OG_DESC_XPATH,))
+			if desc:
+				_memo_put(cache_key, (url, desc))
+				return url, desc
 		except Exception as exc:
 			if self.debug:
 				print(f"Last.fm lookup failed ({escape(kind)}): {escape(str(exc))}")
@@ -136,34 +359,29 @@ class Metadata:
 		kind is one of: song, album, artist.
 		Returns (url, description) if found.
 		"""
+		cache_key = ("allmusic", query, kind)
+		cached = _memo_get(cache_key)
+		if cached is not _MISSING:
+			return cached
 		try:
 			search_url = self._fallback_allmusic_link(query)
-			req = urllib.request.Request(search_url, headers={"User-Agent": "Mozilla/5.0"})
-			with urllib.request.urlopen(req, timeout=5) as resp:
-				if resp.status != 200:
-					return None, None
-				html_text = resp.read().decode("utf-8", errors="ignore")
-			pattern = r'href="(https://www.allmusic.com/(song|album|artist)/[^"]+)"'
-			for match in re.finditer(pattern, html_text, flags=re.IGNORECASE):
-				url = match.group(1)
-				if kind == "song" and "/song/" not in url:
-					continue
-				if kind == "album" and "/album/" not in url:
-					continue
-				if kind == "artist" and "/artist/" not in url:
+			html_body = _cached_get("allmusic_search", search_url)
+			if html_body is None:
+				return None, None
+			html_text = html_body.decode("utf-8", errors="ignore")
+			if not html_text.strip():
+				return None, None
+			detail_prefix = f"https://www.allmusic.com/{kind}/"
+			for url in _HREF_XPATH(lxml.html.fromstring(html_text)):
+				if not url.startswith(detail_prefix):
 					continue
 				# fetch the first matching detail page
-				req_detail = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-				with urllib.request.urlopen(req_detail, timeout=5) as resp_detail:
-					if resp_detail.status != 200:
-						break
-					detail_html = resp_detail.read().decode("utf-8", errors="ignore")
-				meta_match = re.search(r'<meta name="description" content="(.*?)"', detail_html, flags=re.IGNORECASE)
-				if not meta_match:
-					meta_match = re.search(r'<meta property="og:description" content="(.*?)"', detail_html, flags=re.IGNORECASE)
-				if meta_match:
-					desc = html.unescape(meta_match.group(1)).strip()
-					desc = desc.replace("\n", " ")
+				detail_html = _cached_get("allmusic_detail", url, stop_marker=b"</head>")
+				if detail_html is None:
+					break
+				desc = _first_meta_content(detail_html, (_META_DESC_XPATH, _OG_DESC_XPATH))
+				if desc:
+					_memo_put(cache_key, (url, desc))
 					return url, desc
 				break
 		except Exception as exc:
@@ -171,6 +389,27 @@ class Metadata:
 				print(f"AllMusic lookup failed ({escape(kind)}): {escape(str(exc))}")
 		return None, None
 
+	#============================================
+	def _fetch_fallback_description(self, allmusic_query: str, kind: str) -> Tuple[Optional[str], Optional[str]]:
+		"""
+		Queries Last.fm and AllMusic at the same time and returns the first
+		(url, description) that comes back with a description.
+		"""
+		executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+		futures = [
+			executor.submit(self._fetch_lastfm_wiki, kind),
+			executor.submit(self._fetch_allmusic_description, allmusic_query, kind),
+		]
+		result = (None, None)
+		for future in concurrent.futures.as_completed(futures):
+			url, desc = future.result()
+			if desc:
+				result = (url, desc)
+				break
+		# Do not wait on the slower service once a description is found
+		executor.shutdown(wait=False, cancel_futures=True)
+		return result
+
 	#============================================
 	def _fallback_allmusic_link(self, query: str) -> str:
 		"""
@@ -180,139 +419,111 @@ class Metadata:
 		return f"https://www.allmusic.com/search/all/{safe_query}"
 
 	#============================================
-	def _clean_title(self, title):
-		"""Cleans the song title by removing unnecessary text like (feat. ...) or special characters."""
-		title = re.sub(r"\(feat.*?\)", "", title, flags=re.IGNORECASE)
-		title = re.sub(r"[^a-zA-Z0-9\s]", "", title)  # Remove special characters
-		return title.strip()
-
-	#============================================
-	def _fetch_wikipedia_search_titles(self, query: str) -> list:
+	def _fetch_wikipedia_search_pages(self, query: str) -> list | None:
 		"""
-		Searches Wikipedia and returns a list of candidate titles.
+		Searches Wikipedia and returns usable (title, url, extract) tuples
+		in search rank order. A generator=search query returns the hits
+		and their intro extracts in a single Action API request.
+		Returns None when the request or JSON parse fails, so callers can
+		tell a failed search from one with no usable pages.
 		"""
 		if self.debug is True:
 			print(f"Searching wikipedia: query='{escape(query)}'")
 		params = {
 			"action": "query",
-			"list": "search",
-			"srsearch": query,
-			"srlimit": "5",
+			"generator": "search",
+			"gsrsearch": query,
+			# Try a few options to avoid disambiguation pitfalls
+			"gsrlimit": "3",
+			"prop": "extracts|info|pageprops",
+			"exintro": "1",
+			"explaintext": "1",
+			"inprop": "url",
+			"ppprop": "disambiguation",
+			# follow redirect hits to the article that holds the extract
+			"redirects": "1",
 			"format": "json",
 		}
-		search_url = "https://en.wikipedia.org/w/api.php?" + urllib.parse.urlencode(params)
-		time.sleep(random.random())  # Prevent overloading Wikipedia
-		req = urllib.request.Request(search_url, headers={"User-Agent": "Mozilla/5.0"})
+		api_url = "https://en.wikipedia.org/w/api.php"
 		try:
-			with urllib.request.urlopen(req, timeout=5) as resp:
-				if resp.status != 200:
-					return []
-				payload = resp.read().decode("utf-8", errors="ignore")
-		except Exception as error:
+			payload = _cached_get(
+				"wikipedia_search", api_url, params=params, rate_limited=True, headers=WIKIPEDIA_HEADERS
+			)
+			if payload is None:
+				return None
+		except requests.RequestException as error:
 			if self.debug:
 				print(f".. Wikipedia search error: {escape(str(error))}")
-			return []
+			return None
 		try:
+			# json.loads reads the UTF-8 bytes directly, no decode step
 			data = json.loads(payload)
-		except json.JSONDecodeError as error:
+		except ValueError as error:
 			if self.debug:
 				print(f".. Wikipedia JSON parse error: {escape(str(error))}")
-			return []
-		results = data.get("query", {}).get("search", [])
-		titles = []
-		for item in results:
-			title = item.get("title")
-			if title:
-				titles.append(title)
-		return titles
-
-	#============================================
-	def _fetch_wikipedia_summary(self, title: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-		"""
-		Fetches a summary for a Wikipedia title using the REST API.
-		"""
-		safe_title = urllib.parse.quote(title)
-		summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{safe_title}"
-		time.sleep(random.random())  # Delay for API call
-		req = urllib.request.Request(summary_url, headers={"User-Agent": "Mozilla/5.0"})
-		try:
-			with urllib.request.urlopen(req, timeout=5) as resp:
-				if resp.status != 200:
-					return None, None, None
-				payload = resp.read().decode("utf-8", errors="ignore")
-		except Exception as error:
-			if self.debug:
-				print(f".. Wikipedia summary error for {escape(str(title))}: {escape(str(error))}")
-			return None, None, None
-		try:
-			data = json.loads(payload)
-		except json.JSONDecodeError as error:
-			if self.debug:
-				print(f".. Wikipedia summary JSON parse error: {escape(str(error))}")
-			return None, None, None
-		if data.get("type") == "disambiguation":
-			return None, None, None
-		extract = data.get("extract")
-		if not extract:
-			return None, None, None
-		page_title = data.get("title", title)
-		page_url = None
-		content_urls = data.get("content_urls", {})
-		desktop_urls = content_urls.get("desktop", {})
-		if desktop_urls:
-			page_url = desktop_urls.get("page")
-		if not page_url:
-			slug = urllib.parse.quote(page_title.replace(" ", "_"))
-			page_url = f"https://en.wikipedia.org/wiki/{slug}"
-		return page_title, page_url, extract
+			return None
+		pages = list(data.get("query", {}).get("pages", {}).values())
+		pages.sort(key=lambda page: page.get("index", 0))
+		summaries = []
+		for page in pages:
+			summary = _page_summary(page)
+			if summary:
+				summaries.append(summary)
+		return summaries
 
 	#============================================
 	def search_wikipedia(self, query: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
 		"""
 		Searches Wikipedia and returns the best match (title, URL, summary).
+		Repeated queries in the same process are answered from _LOOKUP_CACHE,
+		including searches that succeeded but found no usable page.
+		Queries are case- and whitespace-normalized first; Wikipedia search
+		ignores both, so variants share one memo entry and one request.
 		"""
-		titles = self._fetch_wikipedia_search_titles(query)
-		if not titles:
-			return None, None, None  # No results found
-		options = titles[:3]  # Try a few options to avoid disambiguation pitfalls
-		for candidate in options:
-			page_title, page_url, summary = self._fetch_wikipedia_summary(candidate)
-			if summary:
-				clean_summary_text = self._clean_summary(summary)
-				if self.debug is True:
-					summary_preview = clean_summary_text[:100]
-					print(f".. Summary for {escape(str(candidate))}: {escape(summary_preview)}")
-				return page_title, page_url, clean_summary_text
-		return None, None, None
+		query = " ".join(query.lower().split())
+		cache_key = ("wikipedia", query)
+		cached = _memo_get(cache_key)
+		if cached is not _MISSING:
+			return cached
+		pages = self._fetch_wikipedia_search_pages(query)
+		if pages is None:
+			# failed request, leave it uncached so the next call retries
+			return None, None, None
+		result = (None, None, None)
+		if pages:
+			page_title, page_url, summary = pages[0]
+			clean_summary_text = _clean_summary(summary)
+			if self.debug is True:
+				summary_preview = clean_summary_text[:100]
+				print(f".. Summary for {escape(str(page_title))}: {escape(summary_preview)}")
+			result = (page_title, page_url, clean_summary_text)
+		_memo_put(cache_key, result)
+		return result
 
 	#============================================
-	def fetch_wikipedia_info(self):
+	def _lookup_song(self):
 		"""
-		Fetches Wikipedia summaries for the song, album, and artist.
-		Updates the class attributes with the fetched data.
+		Looks up the song summary with Last.fm and AllMusic fallbacks.
 		"""
-		print(f"{Colors.SKY_BLUE}Searching Wikipedia for:{Colors.ENDC}\n{self}")
-
-		# Fetch song info
-		search_title = self._clean_title(self.title)
+		search_title = self._search_title
 		print(f"{Colors.SKY_BLUE}Searching song page for '{escape(search_title)}'...{Colors.ENDC}")
 		_, self.song_url, self.song_summary = self.search_wikipedia(f"{search_title} song by {self.artist}")
 		if self.song_summary:
 			print(f"{Colors.LIME_GREEN}Received song summary ({len(self.song_summary)} chars).{Colors.ENDC}")
 		if not self.song_summary:
-			lfm_url, lfm_desc = self._fetch_lastfm_wiki(self.artist, search_title, kind="song")
-			if lfm_desc:
-				self.song_url = lfm_url
-				self.song_summary = self._clean_summary(lfm_desc)
-			else:
-				am_url, am_desc = self._fetch_allmusic_description(f"{self.artist} {search_title}", kind="song")
-				if am_desc:
-					self.song_url = am_url
-					self.song_summary = self._clean_summary(am_desc)
+			fb_url, fb_desc = self._fetch_fallback_description(f"{self.artist} {search_title}", kind="song")
+			if fb_desc:
+				self.song_url = fb_url
+				self.song_summary = _clean_summary(fb_desc)
 			if not self.song_summary:
 				self.song_url = self.song_url or self._fallback_allmusic_link(f"{self.artist} {self.title} song")
-				self.song_summary = self.song_summary or "No Wikipedia, Last.fm, or AllMusic summary available."
+				self.song_summary = self.song_summary or NO_SUMMARY_TEXT
 
+	#============================================
+	def _lookup_artist(self):
+		"""
+		Looks up the artist summary with Last.fm and AllMusic fallbacks.
+		"""
 		# Modify artist search query if the name is short (3 characters or fewer)
 		artist_query = f"the artist {self.artist}"
 		# Try searching with "the artist" first
@@ -324,18 +535,52 @@ class Metadata:
 			_, self.artist_url, self.artist_summary = self.search_wikipedia(self.artist)
 
 		if not self.artist_summary:
-			lfm_url, lfm_desc = self._fetch_lastfm_wiki(self.artist, self.artist, kind="artist")
-			if lfm_desc:
-				self.artist_url = lfm_url
-				self.artist_summary = self._clean_summary(lfm_desc)
-			else:
-				am_url, am_desc = self._fetch_allmusic_description(self.artist, kind="artist")
-				if am_desc:
-					self.artist_url = am_url
-					self.artist_summary = self._clean_summary(am_desc)
+			fb_url, fb_desc = self._fetch_fallback_description(self.artist, kind="artist")
+			if fb_desc:
+				self.artist_url = fb_url
+				self.artist_summary = _clean_summary(fb_desc)
 			if not self.artist_summary:
 				self.artist_url = self.artist_url or self._fallback_allmusic_link(self.artist)
-				self.artist_summary = self.artist_summary or "No Wikipedia, Last.fm, or AllMusic summary available."
+				self.artist_summary = self.artist_summary or NO_SUMMARY_TEXT
+
+	#============================================
+	def _lookup_album(self):
+		"""
+		Looks up the album summary with Last.fm and AllMusic fallbacks.
+		"""
+		print(f"{Colors.SKY_BLUE}Searching album page for '{escape(self.album)}'...{Colors.ENDC}")
+		_, self.album_url, self.album_summary = self.search_wikipedia(f"{self.album} album by {self.artist}")
+		if self.album_summary:
+			print(f"{Colors.LIME_GREEN}Received album summary ({len(self.album_summary)} chars).{Colors.ENDC}")
+		if not self.album_summary:
+			fb_url, fb_desc = self._fetch_fallback_description(f"{self.artist} {self.album}", kind="album")
+			if fb_desc:
+				self.album_url = fb_url
+				self.album_summary = _clean_summary(fb_desc)
+			if not self.album_summary:
+				self.album_url = self.album_url or self._fallback_allmusic_link(f"{self.artist} {self.album} album")
+				self.album_summary = self.album_summary or NO_SUMMARY_TEXT
+
+	#============================================
+	def fetch_wikipedia_info(self):
+		"""
+		Fetches Wikipedia summaries for the song, album, and artist.
+		Updates the class attributes with the fetched data.
+		The lookups are network bound, so they run concurrently in threads.
+		"""
+		print(f"{Colors.SKY_BLUE}Searching Wikipedia for:{Colors.ENDC}\n{self}")
+
+		# Missing tags keep the placeholder values, which can never match a page
+		if self.artist == UNKNOWN_ARTIST:
+			print(f"{Colors.DARK_YELLOW}Skipping all lookups (no artist tag).{Colors.ENDC}")
+			return
+
+		lookups = [self._lookup_artist]
+		# short real titles such as "If" still get a song lookup
+		if self.title == UNKNOWN_TITLE or not self._search_title:
+			print(f"{Colors.DARK_YELLOW}Skipping song lookup for '{escape(self.title)}'.{Colors.ENDC}")
+		else:
+			lookups.append(self._lookup_song)
 
 		# Skip album lookup if it's a compilation
 		if self.is_compilation:
@@ -343,24 +588,16 @@ class Metadata:
 				f"{Colors.DARK_YELLOW}Skipping Wikipedia lookup for album "
 				f"'{escape(self.album)}' (detected as a compilation).{Colors.ENDC}"
 			)
+		elif self.album == UNKNOWN_ALBUM:
+			print(f"{Colors.DARK_YELLOW}Skipping album lookup (no album tag).{Colors.ENDC}")
 		else:
-			print(f"{Colors.SKY_BLUE}Searching album page for '{escape(self.album)}'...{Colors.ENDC}")
-			_, self.album_url, self.album_summary = self.search_wikipedia(f"{self.album} album by {self.artist}")
-			if self.album_summary:
-				print(f"{Colors.LIME_GREEN}Received album summary ({len(self.album_summary)} chars).{Colors.ENDC}")
-			if not self.album_summary:
-				lfm_url, lfm_desc = self._fetch_lastfm_wiki(self.artist, self.album, kind="album")
-				if lfm_desc:
-					self.album_url = lfm_url
-					self.album_summary = self._clean_summary(lfm_desc)
-				else:
-					am_url, am_desc = self._fetch_allmusic_description(f"{self.artist} {self.album}", kind="album")
-					if am_desc:
-						self.album_url = am_url
-						self.album_summary = self._clean_summary(am_desc)
-				if not self.album_summary:
-					self.album_url = self.album_url or self._fallback_allmusic_link(f"{self.artist} {self.album} album")
-					self.album_summary = self.album_summary or "No Wikipedia, Last.fm, or AllMusic summary available."
+			lookups.append(self._lookup_album)
+
+		with concurrent.futures.ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+			futures = [executor.submit(lookup) for lookup in lookups]
+			for future in futures:
+				# re-raise any unexpected error from the worker thread
+				future.result()
 
 	#============================================
 	def get_random_chicago_suburb(self) -> str:
@@ -370,63 +607,86 @@ class Metadata:
 		Returns:
 			str: Name of a Chicago suburb.
 		"""
-		suburbs = [
-			"Naperville", "Evanston", "Schaumburg", "Oak Park", "Arlington Heights",
-			"Aurora", "Skokie", "Elmhurst", "Downers Grove", "Wheaton",
-			"Palatine", "Glenview", "Bolingbrook", "Orland Park", "Des Plaines"
-		]
-		return random.choice(suburbs)
+		return random.choice(_CHICAGO_SUBURBS)
+
+	#============================================
+	def has_summary(self) -> bool:
+		"""
+		Return True when at least one lookup produced a real summary.
+		"""
+		summaries = (self.artist_summary, self.album_summary, self.song_summary)
+		return any(summary and summary != NO_SUMMARY_TEXT for summary in summaries)
 
 	#============================================
 	def get_results(self) -> str:
 		"""
 		Generates a formatted string containing Wikipedia search results.
 		"""
-		results = []
-
-		if self.artist_summary:
-			results.append(f"\nArtist: {self.artist}")
-			results.append(f"{self.artist_url}")
-			results.append(f"Summary:\n{self.artist_summary}...")
-
-		if self.album_summary:
-			results.append(f"\nAlbum: {self.album}")
-			results.append(f"{self.album_url}")
-			results.append(f"Summary:\n{self.album_summary}...")
-
-		if self.song_summary:
-			results.append(f"\nSong: {self.title}")
-			results.append(f"{self.song_url}")
-			results.append(f"Summary:\n{self.song_summary}...")
+		# One f-string per section, empty when that summary is missing
+		sections = (
+			f"\nArtist: {self.artist}\n{self.artist_url}\nSummary:\n{self.artist_summary}..."
+			if self.artist_summary else "",
+			f"\nAlbum: {self.album}\n{self.album_url}\nSummary:\n{self.album_summary}..."
+			if self.album_summary else "",
+			f"\nSong: {self.title}\n{self.song_url}\nSummary:\n{self.song_summary}..."
+			if self.song_summary else "",
+		)
+		return "\n".join(filter(None, sections)) or "No relevant Wikipedia pages found."
 
-		if not results:
-			results.append("No relevant Wikipedia pages found.")
+#============================================
+def process_one(filename: str, debug: bool = False) -> str:
+	"""
+	Looks up one audio file and returns its formatted results.
+	"""
+	metadata = Metadata(filename, debug=debug)
+	metadata.fetch_wikipedia_info()
+	return metadata.get_results()
 
-		return "\n".join(results)
+#============================================
+def main_batch(files: list, debug: bool = False) -> None:
+	"""
+	Looks up several audio files concurrently and prints each result as it finishes.
+	The pool is bounded so a large library does not flood the lookup services.
+	"""
+	with concurrent.futures.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+		future_to_file = {executor.submit(process_one, filename, debug): filename for filename in files}
+		for future in concurrent.futures.as_completed(future_to_file):
+			filename = future_to_file[future]
+			try:
+				results = future.result()
+			except (ValueError, mutagen.MutagenError, requests.RequestException, sqlite3.Error) as e:
+				print(f"Error for {escape(filename)}: {escape(str(e))}")
+				continue
+			# Display results only
+			print("=" * 70)
+			print(results)
+			print("=" * 70)
 
 #============================================
 def main():
 	# Parse arguments
-	parser = argparse.ArgumentParser(description="Extract metadata and build DJ prompt for an MP3 or FLAC file.")
-	parser.add_argument("-i", "--input", type=str, required=True, help="Path to the MP3 or FLAC file.")
+	parser = argparse.ArgumentParser(description="Extract metadata and build DJ prompt for MP3 or FLAC files.")
+	parser.add_argument(
+		"-i", "--input", dest="inputs", type=str, action="append", default=[],
+		help="Path to an MP3 or FLAC file (repeat for several files).",
+	)
+	parser.add_argument(
+		"-D", "--input-dir", dest="input_dir", type=str,
+		help="Directory of MP3 or FLAC files to look up.",
+	)
 	parser.add_argument("-d", "--debug", action="store_true", help="Enable verbose logging.")
-	parser.add_argument("-p", "--prompt-only", action="store_true", help="Print only the LLM prompt (suppress metadata block).")
 	args = parser.parse_args()
 
-	# Create metadata object
-	try:
-		metadata = Metadata(args.input, debug=args.debug)
-	except ValueError as e:
-		print(f"Error: {escape(str(e))}")
-		return
+	files = list(args.inputs)
+	if args.input_dir:
+		for path in audio_utils.get_song_list(args.input_dir):
+			if os.path.splitext(path)[1].lower() in (".mp3", ".flac"):
+				files.append(path)
+	if not files:
+		parser.error("provide at least one -i/--input file or -D/--input-dir directory")
 
 	# Fetch Wikipedia data
-	metadata.fetch_wikipedia_info()
-
-	# Display results only
-	print("=" * 70)
-	print(metadata.get_results())
-	print("=" * 70)
+	main_batch(files, debug=args.debug)
 
 #============================================
 if __name__ == "__main__":
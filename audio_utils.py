@@ -2,25 +2,49 @@
 import os
 import re
 import random
+import sqlite3
+import functools
+import concurrent.futures
 
 # PIP3 modules
 import mutagen
 import mutagen.mp3
+import mutagen.id3
 import mutagen.flac
 import mutagen.easyid3
 from rich import print
 from rich.markup import escape
-try:
-	from rich.console import Console
-	RICH_CONSOLE = Console()
-except ImportError:
-	Console = None
-	RICH_CONSOLE = None
 
 # Local repo modules
-from cli_colors import Colors
+import disk_cache
+from cli_colors import Colors, RICH_CONSOLE
 
 #============================================
+# supported audio suffixes, without the dot, for the directory scan
+AUDIO_EXTENSIONS = frozenset(("mp3", "wav", "flac", "ogg"))
+# placeholder tags for files without artist or album metadata
+UNKNOWN_ARTIST = "Unknown Artist"
+UNKNOWN_ALBUM = "Unknown Album"
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+# one_line_info bodies with the color markup baked in once
+_ONE_LINE_TEMPLATE = "{name} | Artist: {artist}"
+_ONE_LINE_COLOR_TEMPLATE = f"{{name}} | Artist: {Colors.OKGREEN}{{artist}}{Colors.ENDC}"
+
+# every ID3 frame except embedded pictures; APIC frames stay raw unknown frames
+_TAG_FRAMES = {name: frame for name, frame in mutagen.id3.Frames.items() if name != "APIC"}
+# tag fields already seen this process, keyed by (path, mtime_ns, size); spares the SQLite round trip
+_SONG_INFO_MEMO = {}
+
+#============================================
+class TagOnlyEasyID3(mutagen.easyid3.EasyID3):
+	"""
+	EasyID3 that skips parsing embedded cover art frames.
+	"""
+	def __init__(self, filename=None):
+		super().__init__()
+		if filename is not None:
+			self.load(filename, known_frames=_TAG_FRAMES)
+
 #============================================
 def get_song_list(directory: str) -> list:
 	"""
@@ -32,16 +56,26 @@ def get_song_list(directory: str) -> list:
 	Returns:
 		list: Audio file paths.
 	"""
-	audio_extensions = [".mp3", ".wav", ".flac", ".ogg"]
 	if not os.path.isdir(directory):
 		raise FileNotFoundError(f"Music directory not found: {directory}")
 
 	song_list = []
-	for root, _, files in os.walk(directory):
-		for filename in files:
-			extension = os.path.splitext(filename)[1].lower()
-			if extension in audio_extensions:
-				song_list.append(os.path.join(root, filename))
+	pending_dirs = [directory]
+	while pending_dirs:
+		try:
+			entries = os.scandir(pending_dirs.pop())
+		except OSError:
+			# unreadable subdirectories are skipped, as os.walk did
+			continue
+		with entries:
+			for entry in entries:
+				if entry.is_dir(follow_symlinks=False):
+					pending_dirs.append(entry.path)
+					continue
+				name = entry.name
+				dot = name.rfind(".")
+				if dot > 0 and name[dot + 1:].lower() in AUDIO_EXTENSIONS:
+					song_list.append(entry.path)
 
 	if not song_list:
 		raise RuntimeError(f"No audio files found in {directory}")
@@ -65,16 +99,12 @@ def select_song(song_list: list, sample_size: int) -> str:
 	choices = random.sample(song_list, sample_size)
 	print(f"{colors.PINK}Please select a song (1-{sample_size}):{colors.ENDC}")
 	index = 1
-	for song in choices:
-		song_obj = song if isinstance(song, Song) else Song(song)
+	for song_obj in build_songs(choices):
 		print(f"{colors.OKBLUE}{index}:{colors.ENDC} {song_obj.one_line_info(color=True)}")
 		index += 1
 
 	while True:
-		if RICH_CONSOLE:
-			user_input = RICH_CONSOLE.input(f"{colors.CYAN}Enter number:{colors.ENDC} ").strip()
-		else:
-			user_input = input("Enter number: ").strip()
+		user_input = RICH_CONSOLE.input(f"{colors.CYAN}Enter number:{colors.ENDC} ").strip()
 		if user_input.isdigit():
 			selected = int(user_input) - 1
 			if 0 <= selected < sample_size:
@@ -97,11 +127,93 @@ def select_song_list(song_list: list, sample_size: int) -> list:
 	sample_size = max(1, min(sample_size, len(song_list)))
 	return random.sample(song_list, sample_size)
 
+#============================================
+def _as_song(item) -> "Song":
+	"""
+	Return item unchanged if it is a Song, else build a Song from the path.
+	"""
+	if isinstance(item, Song):
+		return item
+	return Song(item)
+
+#============================================
+def build_songs(paths: list, max_workers: int = 16) -> list:
+	"""
+	Build Song objects for many paths in parallel threads.
+
+	Tag parsing waits on disk reads, so threads overlap the I/O.
+
+	Args:
+		paths (list): Song paths or Song objects (passed through).
+		max_workers (int): Thread pool size.
+
+	Returns:
+		list: Song objects in the same order as paths.
+	"""
+	if len(paths) <= 1:
+		return [_as_song(item) for item in paths]
+	with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+		return list(executor.map(_as_song, paths))
+
+#============================================
+def format_song_lines(songs: list, color: bool = False) -> str:
+	"""
+	Return one-line summaries for a song list as one block, ordered by artist, album, and title.
+
+	Args:
+		songs (list): Song objects.
+		color (bool): Include rich color markup.
+
+	Returns:
+		str: Newline-joined summary lines.
+	"""
+	# sort the songs, not the formatted lines, so markup never affects the order
+	ordered = sorted(songs, key=_song_sort_key)
+	return "\n".join(song.one_line_info(color=color) for song in ordered)
+
+#============================================
+def _song_sort_key(song) -> tuple:
+	return (
+		(song.artist or "").casefold(),
+		(song.album or "").casefold(),
+		(song.title or "").casefold(),
+		song.basename,
+	)
+
+#============================================
+def has_real_tags(song) -> bool:
+	"""
+	Return True when a song has an artist tag or a title other than its file name.
+	"""
+	stem = os.path.splitext(song.basename)[0]
+	return song.artist != UNKNOWN_ARTIST or song.title != stem
+
+#============================================
+def format_candidate_lines(songs: list) -> list:
+	"""
+	Return the plain candidate lines used in song selection prompts.
+
+	Args:
+		songs (list): Song objects.
+
+	Returns:
+		list: One "- file | Artist | Album | Title" line per song.
+	"""
+	return [
+		f"- {song.basename} | Artist: {song.artist} | Album: {song.album} | Title: {song.title}"
+		for song in songs
+	]
+
 #============================================
 class Song:
 	"""
 	Represents a song file with cached metadata and info helpers.
 	"""
+	__slots__ = (
+		"path", "basename", "debug", "title", "artist", "album", "is_compilation",
+		"length_seconds", "size_bytes", "year",
+	)
+
 	#============================================
 	def __init__(self, path: str, debug: bool = False):
 		"""
@@ -112,10 +224,12 @@ class Song:
 			debug (bool): Enable verbose logging.
 		"""
 		self.path = path
+		# file name shown in lists and prompts; computed once per song
+		self.basename = os.path.basename(path)
 		self.debug = debug
-		self.title = os.path.splitext(os.path.basename(path))[0]
-		self.artist = "Unknown Artist"
-		self.album = "Unknown Album"
+		self.title = os.path.splitext(self.basename)[0]
+		self.artist = UNKNOWN_ARTIST
+		self.album = UNKNOWN_ALBUM
 		self.is_compilation = False
 		self.length_seconds = None
 		self.size_bytes = None
@@ -126,61 +240,121 @@ class Song:
 	def _load_file_info(self) -> None:
 		"""
 		Load size and length plus tags for mp3/flac files.
+		Tags for unchanged files come from an in-process memo, then the disk_cache songs table.
 		"""
-		if os.path.exists(self.path):
-			self.size_bytes = os.path.getsize(self.path)
-		lower = self.path.lower()
 		try:
-			if lower.endswith(".mp3"):
-				audio = mutagen.mp3.MP3(self.path, ID3=mutagen.easyid3.EasyID3)
-				self.length_seconds = int(audio.info.length) if audio.info and audio.info.length else None
-				self.title = (audio.get("title") or [self.title])[0]
-				self.artist = (audio.get("artist") or [self.artist])[0]
-				self.album = (audio.get("album") or [self.album])[0]
-				self.is_compilation = (audio.get("TCMP") or ["0"])[0] == "1"
-				self.year = self.year or _extract_year_from_candidates(
-					audio.get("originaldate"),
-					audio.get("date"),
-					audio.get("year"),
-					getattr(audio, "tags", {}).get("TDRC") if getattr(audio, "tags", None) else None,
-				)
-			elif lower.endswith(".flac"):
-				audio = mutagen.flac.FLAC(self.path)
-				self.length_seconds = int(audio.info.length) if audio.info and audio.info.length else None
-				self.title = (audio.get("title") or [self.title])[0]
-				self.artist = (audio.get("artist") or [self.artist])[0]
-				self.album = (audio.get("album") or [self.album])[0]
-				self.is_compilation = (audio.get("compilation") or ["0"])[0] == "1"
-				self.year = self.year or _extract_year_from_candidates(
-					audio.get("originaldate"),
-					audio.get("date"),
-					audio.get("year"),
-				)
+			stat_result = os.stat(self.path)
+			self.size_bytes = stat_result.st_size
+		except OSError:
+			stat_result = None
+		loader = _TAG_LOADERS.get(os.path.splitext(self.path)[1].lower())
+		if loader is None:
+			return
+		memo_key = None
+		if stat_result is not None:
+			memo_key = (self.path, stat_result.st_mtime_ns, stat_result.st_size)
+			cached = _SONG_INFO_MEMO.get(memo_key)
+			if cached is None:
+				cached = self._cached_song_info(memo_key)
+			if cached is not None:
+				_SONG_INFO_MEMO[memo_key] = cached
+				self._apply_tag_info(cached)
+				return
+		try:
+			loader(self)
 		except Exception as error:
 			if self.debug:
 				print(f"Metadata load failed for {escape(self.path)}: {escape(str(error))}")
+			return
+		if memo_key is not None:
+			info = self._tag_info()
+			_SONG_INFO_MEMO[memo_key] = info
+			try:
+				disk_cache.store_song_info(*memo_key, info)
+			except (sqlite3.Error, OSError) as error:
+				if self.debug:
+					print(f"Song cache write failed for {escape(self.path)}: {escape(str(error))}")
+
+	#============================================
+	def _cached_song_info(self, memo_key: tuple) -> dict | None:
+		"""
+		Read tags from the disk_cache songs table; a broken cache counts as a miss.
+		"""
+		try:
+			return disk_cache.get_song_info(*memo_key)
+		except (sqlite3.Error, OSError) as error:
+			if self.debug:
+				print(f"Song cache read failed for {escape(self.path)}: {escape(str(error))}")
+			return None
+
+	#============================================
+	def _load_mp3_tags(self) -> None:
+		"""
+		Read length and tags from an MP3 file.
+		"""
+		audio = mutagen.mp3.MP3(self.path, ID3=TagOnlyEasyID3)
+		self.length_seconds = int(audio.info.length) if audio.info and audio.info.length else None
+		self.title = (audio.get("title") or [self.title])[0]
+		self.artist = (audio.get("artist") or [self.artist])[0]
+		self.album = (audio.get("album") or [self.album])[0]
+		self.is_compilation = (audio.get("TCMP") or ["0"])[0] == "1"
+		self.year = self.year or _extract_year_from_candidates(
+			audio.get("originaldate"),
+			audio.get("date"),
+			audio.get("year"),
+			getattr(audio, "tags", {}).get("TDRC") if getattr(audio, "tags", None) else None,
+		)
+
+	#============================================
+	def _load_flac_tags(self) -> None:
+		"""
+		Read length and tags from a FLAC file.
+		"""
+		audio = mutagen.flac.FLAC(self.path)
+		self.length_seconds = int(audio.info.length) if audio.info and audio.info.length else None
+		self.title = (audio.get("title") or [self.title])[0]
+		self.artist = (audio.get("artist") or [self.artist])[0]
+		self.album = (audio.get("album") or [self.album])[0]
+		self.is_compilation = (audio.get("compilation") or ["0"])[0] == "1"
+		self.year = self.year or _extract_year_from_candidates(
+			audio.get("originaldate"),
+			audio.get("date"),
+			audio.get("year"),
+		)
+
+	#============================================
+	def _tag_info(self) -> dict:
+		"""
+		Return the tag-derived fields stored in the song cache.
+		"""
+		info = {
+			"title": self.title,
+			"artist": self.artist,
+			"album": self.album,
+			"year": self.year,
+			"length_seconds": self.length_seconds,
+			"is_compilation": self.is_compilation,
+		}
+		return info
+
+	#============================================
+	def _apply_tag_info(self, info: dict) -> None:
+		"""
+		Set the tag-derived fields from a song cache entry.
+		"""
+		self.title = info["title"]
+		self.artist = info["artist"]
+		self.album = info["album"]
+		self.year = info["year"]
+		self.length_seconds = info["length_seconds"]
+		self.is_compilation = info["is_compilation"]
 
 	#============================================
 	def one_line_info(self, color: bool = False) -> str:
 		"""
 		Return a one-line summary for selection lists.
 		"""
-		c = Colors if color else None
-		parts = []
-		length_display = self.formatted_length()
-		if length_display:
-			parts.append(f"{length_display}")
-		base_name = os.path.basename(self.path)
-		parts.append(escape(base_name) if color else base_name)
-		if color:
-			artist = escape(self.artist)
-			parts.append(f"Artist: {c.OKGREEN}{artist}{c.ENDC}")
-		else:
-			parts.append(f"Artist: {self.artist}")
-		#parts.append(f"Album: {c.OKCYAN}{self.album}{c.ENDC}")
-		if self.year:
-			parts.append(f"({self.year})")
-		return " | ".join(parts)
+		return _one_line_text(self.basename, self.artist, self.length_seconds, self.year, color)
 
 	#============================================
 	def multiline_info(self, color: bool = False) -> str:
@@ -216,10 +390,38 @@ class Song:
 		"""
 		Return length in MM:SS if available.
 		"""
-		if not self.length_seconds or self.length_seconds <= 0:
-			return ""
-		minutes, seconds = divmod(int(self.length_seconds), 60)
-		return f"{minutes:02d}:{seconds:02d}"
+		return _format_length(self.length_seconds)
+
+#============================================
+def _format_length(length_seconds) -> str:
+	if not length_seconds or length_seconds <= 0:
+		return ""
+	minutes, seconds = divmod(int(length_seconds), 60)
+	return f"{minutes:02d}:{seconds:02d}"
+
+#============================================
+@functools.lru_cache(maxsize=4096)
+def _one_line_text(base_name: str, artist: str, length_seconds, year, color: bool) -> str:
+	"""
+	Format a one-line song summary; keyed on the displayed fields, so edited tags miss the cache.
+	"""
+	if color:
+		line = _ONE_LINE_COLOR_TEMPLATE.format(name=escape(base_name), artist=escape(artist))
+	else:
+		line = _ONE_LINE_TEMPLATE.format(name=base_name, artist=artist)
+	length_display = _format_length(length_seconds)
+	if length_display:
+		line = f"{length_display} | {line}"
+	if year:
+		line = f"{line} | ({year})"
+	return line
+
+#============================================
+# tag readers by lowercase file extension
+_TAG_LOADERS = {
+	".mp3": Song._load_mp3_tags,
+	".flac": Song._load_flac_tags,
+}
 
 #============================================
 def _extract_year_from_candidates(*candidates) -> str | None:
@@ -239,8 +441,13 @@ def _extract_year_value(value) -> str | None:
 			if year:
 				return year
 		return None
-	text = str(value).strip()
-	match = re.search(r"(19|20)\d{2}", text)
+	return _extract_year_text(str(value))
+
+#============================================
+@functools.lru_cache(maxsize=2048)
+def _extract_year_text(value: str) -> str | None:
+	text = value.strip()
+	match = _YEAR_RE.search(text)
 	if match:
 		return match.group(0)
 	if text.isdigit() and len(text) == 4:
@@ -1,11 +1,18 @@
 # Standard Library
-import array
+import math
 import os
+import stat
+import atexit
+import struct
 import tempfile
-import wave
+import threading
+import collections
 
 # PIP3 modules
+import numpy
 import pygame
+import soundfile
+import scipy.signal
 from rich import print
 from rich.markup import escape
 
@@ -15,37 +22,174 @@ from cli_colors import Colors
 #============================================
 DEFAULT_PLAYBACK_RATE = 44100
 DEFAULT_TRANSCRIBE_RATE = 16000
+# One mixer format for the whole process. These match pygame's own init()
+# defaults used by playback_helpers and tts_helpers, so whichever module opens
+# the shared mixer first, music playback never ends up at a transcription rate.
+MIXER_FREQUENCY = DEFAULT_PLAYBACK_RATE
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+WAV_WRITE_BUFFER_BYTES = 1 << 20
+# frames per soundfile block when streaming a file straight to WAV
+STREAM_BLOCK_FRAMES = 1 << 16
+# Linux tmpfs keeps temporary WAVs in RAM; elsewhere use the default temp dir
+TEMP_WAV_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+# pygame mixer size -> (sample_width, signed)
+_SIZE_FORMATS = {
+	8: (1, False), -8: (1, True),
+	16: (2, False), -16: (2, True),
+	32: (4, False), -32: (4, True),
+}
+# (sample_width, signed) -> numpy dtype; WAV stores 16/32-bit PCM signed, so
+# unsigned decodes of those widths are re-centered by _recenter_unsigned
+_DTYPES = {
+	(1, True): "int8", (1, False): "uint8",
+	(2, True): "int16", (2, False): "uint16",
+	(4, True): "int32", (4, False): "uint32",
+}
+# decoded WAVs kept for reuse, keyed by (path, mtime_ns, rate, channels)
+MAX_CACHED_WAVS = 4
+
+_WAV_CACHE = collections.OrderedDict()
+# handed-out WAV paths -> callers that have not called release_wav yet
+_WAV_HOLDERS = collections.Counter()
+# evicted WAVs that a caller still holds; removed on release or at exit
+_RETIRED_WAVS = set()
+_WAV_CACHE_LOCK = threading.Lock()
+
+#============================================
+def _unlink_quietly(path: str) -> None:
+	try:
+		os.unlink(path)
+	except OSError:
+		pass
+
+#============================================
+def _discard_wav(path: str) -> None:
+	# caller holds _WAV_CACHE_LOCK; a held file waits for release_wav
+	if _WAV_HOLDERS[path] > 0:
+		_RETIRED_WAVS.add(path)
+	else:
+		_unlink_quietly(path)
+
+#============================================
+def _remember_wav(key: tuple, path: str) -> str:
+	"""
+	Store a decoded WAV path and hand it out, evicting the least recently used past MAX_CACHED_WAVS.
+	Returns the cached path, which differs from path when another thread decoded the file first.
+	"""
+	with _WAV_CACHE_LOCK:
+		existing = _WAV_CACHE.get(key)
+		if existing and existing != path and os.path.exists(existing):
+			# lost a decode race; keep the winner's copy and drop ours
+			_unlink_quietly(path)
+			path = existing
+		_WAV_CACHE[key] = path
+		_WAV_CACHE.move_to_end(key)
+		_WAV_HOLDERS[path] += 1
+		while len(_WAV_CACHE) > MAX_CACHED_WAVS:
+			_, oldest_path = _WAV_CACHE.popitem(last=False)
+			_discard_wav(oldest_path)
+	return path
+
+#============================================
+def release_wav(path: str) -> None:
+	"""
+	Tell the cache a caller is done reading a WAV from create_temp_wav.
+	"""
+	with _WAV_CACHE_LOCK:
+		if _WAV_HOLDERS[path] > 1:
+			_WAV_HOLDERS[path] -= 1
+			return
+		_WAV_HOLDERS.pop(path, None)
+		if path in _RETIRED_WAVS:
+			_RETIRED_WAVS.discard(path)
+			_unlink_quietly(path)
+
+#============================================
+def _remove_cached_wavs() -> None:
+	with _WAV_CACHE_LOCK:
+		for path in set(_WAV_CACHE.values()) | _RETIRED_WAVS:
+			_unlink_quietly(path)
+		_WAV_CACHE.clear()
+		_RETIRED_WAVS.clear()
+		_WAV_HOLDERS.clear()
+
+atexit.register(_remove_cached_wavs)
 
 #============================================
 def _sample_format_from_size(size: int) -> tuple[int, bool]:
-	width = abs(size) // 8
-	if width in (1, 2, 4):
-		return width, size < 0
-	return 2, True
+	return _SIZE_FORMATS.get(size, (2, True))
 
 #============================================
-def ensure_mixer_initialized(frequency: int, size: int, channels: int) -> None:
+def ensure_mixer_initialized() -> None:
 	if pygame.mixer.get_init():
 		return
-	pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+	pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE, channels=MIXER_CHANNELS)
 
 #============================================
-def _write_wav(path: str, raw: bytes, channels: int, sample_width: int, rate: int) -> None:
-	with wave.open(path, "wb") as wav_file:
-		wav_file.setnchannels(channels)
-		wav_file.setsampwidth(sample_width)
-		wav_file.setframerate(rate)
-		wav_file.writeframes(raw)
+def _wav_header(data_bytes: int, channels: int, sample_width: int, rate: int) -> bytes:
+	"""
+	Build the 44-byte RIFF/WAVE header for integer PCM data.
+	"""
+	block_align = channels * sample_width
+	riff_size = 36 + data_bytes + (data_bytes & 1)
+	return struct.pack(
+		"<4sI4s4sIHHIIHH4sI",
+		b"RIFF", riff_size, b"WAVE",
+		b"fmt ", 16, 1, channels, rate, rate * block_align, block_align, sample_width * 8,
+		b"data", data_bytes,
+	)
 
 #============================================
-def _sample_typecode(sample_width: int, signed: bool) -> str | None:
-	if sample_width == 1:
-		return "b" if signed else "B"
-	if sample_width == 2:
-		return "h"
-	if sample_width == 4:
-		return "i"
-	return None
+def _write_wav(path: str, raw, channels: int, sample_width: int, rate: int) -> None:
+	"""
+	Write PCM frames from any bytes-like buffer to a WAV file.
+	The frame count is known up front, so the header is written once
+	and the file is never reopened or seeked to patch sizes.
+	"""
+	# the 1 MiB buffer folds the header into the first frame write
+	with open(path, "wb", buffering=WAV_WRITE_BUFFER_BYTES) as handle:
+		_write_wav_to(handle, raw, channels, sample_width, rate)
+
+#============================================
+def _write_wav_to(handle, raw, channels: int, sample_width: int, rate: int) -> None:
+	"""
+	Write a WAV header and PCM frames to an already open binary handle.
+	"""
+	data_bytes = len(raw) // (channels * sample_width) * (channels * sample_width)
+	handle.write(_wav_header(data_bytes, channels, sample_width, rate))
+	handle.write(memoryview(raw)[:data_bytes])
+	if data_bytes & 1:
+		# RIFF chunks are word aligned
+		handle.write(b"\x00")
+
+#============================================
+def _sample_dtype(sample_width: int, signed: bool) -> str | None:
+	return _DTYPES.get((sample_width, signed))
+
+#============================================
+def _convert_channels_numpy(raw: bytes, dtype: str, src_channels: int) -> tuple[memoryview, int]:
+	samples = numpy.frombuffer(raw, dtype=dtype)
+	if src_channels == 2:
+		# drop a trailing half frame, then average each L/R pair in int64
+		pairs = samples[: len(samples) // 2 * 2].reshape(-1, 2)
+		mono = pairs.sum(axis=1, dtype=numpy.int64) >> 1
+		return memoryview(mono.astype(dtype)).cast("B"), 1
+	# hand the array buffer on as bytes without a tobytes() copy
+	return memoryview(numpy.repeat(samples, 2)).cast("B"), 2
+
+#============================================
+def _resample(raw, dtype: str, channels: int, src_rate: int, dst_rate: int) -> memoryview:
+	"""
+	Resample interleaved PCM with a scipy polyphase filter.
+	"""
+	samples = numpy.frombuffer(raw, dtype=dtype)
+	samples = samples[: len(samples) // channels * channels].reshape(-1, channels)
+	divisor = math.gcd(src_rate, dst_rate)
+	resampled = scipy.signal.resample_poly(samples, dst_rate // divisor, src_rate // divisor, axis=0)
+	limits = numpy.iinfo(dtype)
+	resampled = numpy.clip(numpy.rint(resampled), limits.min, limits.max).astype(dtype)
+	return memoryview(resampled).cast("B")
 
 #============================================
 def _convert_channels(
@@ -54,54 +198,44 @@ def _convert_channels(
 	signed: bool,
 	src_channels: int,
 	dst_channels: int,
-) -> tuple[bytes, int]:
-	if src_channels == dst_channels:
+) -> tuple[bytes | memoryview, int]:
+	if src_channels == dst_channels or not raw:
 		return raw, src_channels
 	if src_channels not in (1, 2) or dst_channels not in (1, 2):
 		return raw, src_channels
-	typecode = _sample_typecode(sample_width, signed)
-	if not typecode:
+	dtype = _sample_dtype(sample_width, signed)
+	if not dtype:
 		return raw, src_channels
-
-	samples = array.array(typecode)
-	samples.frombytes(raw)
-
-	if src_channels == 2 and dst_channels == 1:
-		mono = array.array(typecode)
-		for index in range(0, len(samples), 2):
-			left = samples[index]
-			right = samples[index + 1] if index + 1 < len(samples) else left
-			if typecode == "B":
-				mono.append((left + right) // 2)
-			else:
-				mono.append(int((left + right) / 2))
-		return mono.tobytes(), 1
-
-	if src_channels == 1 and dst_channels == 2:
-		stereo = array.array(typecode)
-		for sample in samples:
-			stereo.append(sample)
-			stereo.append(sample)
-		return stereo.tobytes(), 2
-	return raw, src_channels
+	return _convert_channels_numpy(raw, dtype, src_channels)
 
 #============================================
-def create_temp_wav(
-	audio_path: str,
-	rate: int,
-	channels: int,
-	size: int = -16,
-) -> str | None:
+def _read_with_soundfile(audio_path: str) -> tuple | None:
 	"""
-	Decode an audio file with pygame and write a temporary WAV file.
+	Decode straight to 16-bit PCM with libsndfile, without the pygame mixer.
+
+	Returns:
+		tuple | None: (pcm, channels, sample_width, signed, rate), or None when
+		libsndfile cannot read the format or the file is not mono/stereo.
 	"""
-	if not audio_path:
+	try:
+		samples, sample_rate = soundfile.read(audio_path, dtype="int16", always_2d=True)
+	except Exception:
+		# e.g. MP3 on an older libsndfile; pygame decodes those
 		return None
-	if not os.path.isfile(audio_path):
-		print(f"{Colors.WARNING}Audio file not found: {escape(audio_path)}{Colors.ENDC}")
+	channels = samples.shape[1]
+	if channels not in (1, 2):
 		return None
+	return memoryview(numpy.ascontiguousarray(samples)).cast("B"), channels, 2, True, sample_rate
+
+#============================================
+def _read_with_pygame(audio_path: str) -> tuple | None:
+	"""
+	Decode with pygame in the shared mixer format.
 
-	ensure_mixer_initialized(rate, size, channels)
+	Returns:
+		tuple | None: (pcm, channels, sample_width, signed, rate), or None on failure.
+	"""
+	ensure_mixer_initialized()
 	init = pygame.mixer.get_init()
 	if not init:
 		print(f"{Colors.WARNING}pygame mixer not initialized; skipping WAV.{Colors.ENDC}")
@@ -112,34 +246,186 @@ def create_temp_wav(
 
 	try:
 		sound = pygame.mixer.Sound(audio_path)
-		raw = sound.get_raw()
+		# Sound exports its sample buffer; a byte view avoids the get_raw() copy
+		raw = memoryview(sound).cast("B")
 	except Exception as error:
 		print(f"{Colors.WARNING}Failed to decode audio with pygame: {escape(str(error))}{Colors.ENDC}")
 		return None
+	return raw, init_channels, sample_width, signed, frequency
+
+#============================================
+def _decode_source(audio_path: str) -> tuple | None:
+	"""
+	Decode an audio file in its native layout.
+	libsndfile is tried first; pygame handles formats it cannot read.
 
-	raw, out_channels = _convert_channels(raw, sample_width, signed, init_channels, channels)
+	Returns:
+		tuple | None: (pcm, channels, sample_width, signed, rate), or None on failure.
+	"""
+	return _read_with_soundfile(audio_path) or _read_with_pygame(audio_path)
+
+#============================================
+def _recenter_unsigned(raw, sample_width: int) -> memoryview:
+	"""
+	Turn unsigned PCM into signed PCM of the same width by flipping the sign bit.
+	"""
+	dtype = numpy.dtype(_sample_dtype(sample_width, False))
+	samples = numpy.frombuffer(raw, dtype=dtype, count=len(raw) // sample_width)
+	flipped = samples ^ dtype.type(1 << (8 * sample_width - 1))
+	return memoryview(flipped.view(_sample_dtype(sample_width, True))).cast("B")
+
+#============================================
+def _convert_pcm(decoded: tuple, rate: int, channels: int) -> tuple:
+	"""
+	Convert decoded PCM to the requested channel count and sample rate.
+	The source buffer is never modified, so one decode can feed several conversions.
+	"""
+	raw, src_channels, sample_width, signed, frequency = decoded
+	if sample_width > 1 and not signed:
+		raw = _recenter_unsigned(raw, sample_width)
+		signed = True
+	out_channels = src_channels
+	if src_channels != channels:
+		raw, out_channels = _convert_channels(raw, sample_width, signed, src_channels, channels)
 	if frequency != rate:
-		print(f"{Colors.WARNING}pygame mixer rate {frequency} != requested {rate}; using {frequency}.{Colors.ENDC}")
-		rate = frequency
+		dtype = _sample_dtype(sample_width, signed)
+		if dtype:
+			raw = _resample(raw, dtype, out_channels, frequency, rate)
+		else:
+			print(f"{Colors.WARNING}Decoded rate {frequency} != requested {rate}; using {frequency}.{Colors.ENDC}")
+			rate = frequency
+	return raw, out_channels, sample_width, signed, rate
 
-	with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as handle:
-		temp_path = handle.name
+#============================================
+def _stat_audio_file(audio_path: str) -> os.stat_result | None:
+	"""
+	Stat an audio file once for both the existence check and the cache key.
+	"""
+	if not audio_path:
+		return None
+	try:
+		stat_result = os.stat(audio_path)
+	except OSError:
+		stat_result = None
+	if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+		print(f"{Colors.WARNING}Audio file not found: {escape(audio_path)}{Colors.ENDC}")
+		return None
+	return stat_result
+
+#============================================
+def _cached_wav(cache_key: tuple) -> str | None:
+	with _WAV_CACHE_LOCK:
+		cached_path = _WAV_CACHE.get(cache_key)
+		if not cached_path or not os.path.exists(cached_path):
+			return None
+		_WAV_CACHE.move_to_end(cache_key)
+		_WAV_HOLDERS[cached_path] += 1
+	return cached_path
+
+#============================================
+def _open_temp_wav():
+	"""
+	Create a temporary WAV file and return its open, buffered binary handle.
+	"""
+	return tempfile.NamedTemporaryFile(
+		mode="wb",
+		buffering=WAV_WRITE_BUFFER_BYTES,
+		suffix=".wav",
+		dir=TEMP_WAV_DIR,
+		delete=False,
+	)
+
+#============================================
+def _write_temp_wav(cache_key: tuple, decoded: tuple, rate: int, channels: int) -> str | None:
+	"""
+	Convert decoded PCM, write it to a cached temporary WAV, and return the path.
+	"""
+	raw, out_channels, sample_width, _, out_rate = _convert_pcm(decoded, rate, channels)
 
+	# write through the handle that created the file instead of reopening it
+	handle = _open_temp_wav()
 	try:
-		_write_wav(temp_path, raw, out_channels, sample_width, rate)
+		with handle:
+			_write_wav_to(handle, raw, out_channels, sample_width, out_rate)
 	except Exception as error:
 		print(f"{Colors.WARNING}Failed to write WAV: {escape(str(error))}{Colors.ENDC}")
-		try:
-			os.unlink(temp_path)
-		except OSError:
-			pass
+		_unlink_quietly(handle.name)
 		return None
+	return _remember_wav(cache_key, handle.name)
+
+#============================================
+def _stream_temp_wav(audio_path: str, rate: int, channels: int) -> str | None:
+	"""
+	Copy a file to a temporary 16-bit WAV one soundfile block at a time.
+
+	Only used when the source already has the requested rate, so no resample
+	needs the whole track; peak memory is one block rather than the full PCM.
+	Returns None when streaming is not possible and the caller should decode in full.
+	"""
+	try:
+		source = soundfile.SoundFile(audio_path)
+	except Exception:
+		return None
+	with source:
+		src_channels = source.channels
+		if source.samplerate != rate or src_channels not in (1, 2):
+			return None
+		handle = _open_temp_wav()
+		temp_path = handle.name
+		data_bytes = source.frames * channels * 2
+		written = 0
+		try:
+			with handle:
+				handle.write(_wav_header(data_bytes, channels, 2, rate))
+				blocks = source.blocks(blocksize=STREAM_BLOCK_FRAMES, dtype="int16", always_2d=True)
+				for block in blocks:
+					raw = memoryview(numpy.ascontiguousarray(block)).cast("B")
+					if src_channels != channels:
+						raw, _ = _convert_channels(raw, 2, True, src_channels, channels)
+					handle.write(raw)
+					written += len(raw)
+				if written != data_bytes:
+					# the frame count in the source header was an estimate
+					handle.seek(0)
+					handle.write(_wav_header(written, channels, 2, rate))
+		except Exception:
+			_unlink_quietly(temp_path)
+			return None
 	return temp_path
 
+#============================================
+def create_temp_wav(
+	audio_path: str,
+	rate: int,
+	channels: int,
+) -> str | None:
+	"""
+	Decode an audio file and write a temporary WAV file.
+	The WAV is owned by the module cache: repeat calls for an unchanged file
+	return the same path. Call release_wav when done; an evicted file is
+	removed once every caller has released it, or at exit.
+	"""
+	stat_result = _stat_audio_file(audio_path)
+	if stat_result is None:
+		return None
+	cache_key = (audio_path, stat_result.st_mtime_ns, rate, channels)
+	cached_path = _cached_wav(cache_key)
+	if cached_path:
+		return cached_path
+
+	temp_path = _stream_temp_wav(audio_path, rate, channels)
+	if temp_path:
+		return _remember_wav(cache_key, temp_path)
+
+	decoded = _decode_source(audio_path)
+	if decoded is None:
+		return None
+	return _write_temp_wav(cache_key, decoded, rate, channels)
+
 #============================================
 def create_playback_wav(audio_path: str) -> str | None:
-	return create_temp_wav(audio_path, DEFAULT_PLAYBACK_RATE, channels=2, size=-16)
+	return create_temp_wav(audio_path, DEFAULT_PLAYBACK_RATE, channels=2)
 
 #============================================
 def create_transcription_wav(audio_path: str) -> str | None:
-	return create_temp_wav(audio_path, DEFAULT_TRANSCRIBE_RATE, channels=1, size=-16)
+	return create_temp_wav(audio_path, DEFAULT_TRANSCRIBE_RATE, channels=1)
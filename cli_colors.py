@@ -1,7 +1,11 @@
 """
-Shared rich markup color tokens for CLI output.
+Shared rich markup color tokens and console for CLI output.
 """
 
+# PIP3 modules
+from rich.console import Console
+from rich.theme import Theme
+
 #============================================
 class Colors:
 	RED = "[#e60000]"
@@ -30,3 +34,18 @@ class Colors:
 	ENDC = "[/]"
 	BOLD = "[bold]"
 	UNDERLINE = "[underline]"
+
+#============================================
+# named styles for RICH_CONSOLE.print(..., style=...), parsed once at import
+THEME = Theme({
+	"header": "#0039e6",
+	"okblue": "#0039e6",
+	"okcyan": "#00b3b3",
+	"okgreen": "#009900",
+	"okmagenta": "#b30077",
+	"warning": "#e69100",
+	"fail": "#e60000",
+	"dj_panel": "#7b12a1",
+})
+# one console for the whole CLI so style and terminal detection happen once
+RICH_CONSOLE = Console(theme=THEME)
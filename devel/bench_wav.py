@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Profile temporary WAV creation to find the hot spots before optimizing.
+
+Example:
+	python3 devel/bench_wav.py -i song.mp3 -r 10 -o output/bench_wav.prof
+	snakeviz output/bench_wav.prof
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import pstats
+import argparse
+import cProfile
+
+# Local repo modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import audio_wav
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Profile audio_wav temporary WAV creation.")
+	parser.add_argument("-i", "--input", dest="input_file", required=True, help="Audio file to decode.")
+	parser.add_argument("-r", "--repeats", dest="repeats", type=int, default=10, help="Number of decodes to profile.")
+	parser.add_argument(
+		"-m", "--mode", dest="mode", choices=("playback", "transcription"), default="transcription",
+		help="Which WAV builder to profile.",
+	)
+	parser.add_argument("-o", "--output", dest="output_file", default="bench_wav.prof", help="cProfile stats file for snakeviz.")
+	args = parser.parse_args()
+	return args
+
+#============================================
+def run_once(audio_path: str, mode: str) -> None:
+	"""
+	Build one WAV from scratch, bypassing the module WAV cache.
+	"""
+	audio_wav._remove_cached_wavs()
+	if mode == "playback":
+		audio_wav.create_playback_wav(audio_path)
+	else:
+		audio_wav.create_transcription_wav(audio_path)
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	# warm up so mixer init and imports do not skew the profile
+	run_once(args.input_file, args.mode)
+
+	profiler = cProfile.Profile()
+	start = time.perf_counter()
+	profiler.enable()
+	for _ in range(args.repeats):
+		run_once(args.input_file, args.mode)
+	profiler.disable()
+	elapsed = time.perf_counter() - start
+	audio_wav._remove_cached_wavs()
+
+	output_dir = os.path.dirname(args.output_file)
+	if output_dir:
+		os.makedirs(output_dir, exist_ok=True)
+	profiler.dump_stats(args.output_file)
+	print(f"{args.repeats} x {args.mode}: {elapsed / max(args.repeats, 1) * 1000:.1f} ms per file")
+	pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+	print(f"Stats written to {args.output_file}; view with: snakeviz {args.output_file}")
+
+#============================================
+if __name__ == "__main__":
+	main()
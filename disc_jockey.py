@@ -3,21 +3,23 @@
 # Standard Library
 import os
 import time
+import atexit
 import argparse
 import threading
 import re
 import random
+import concurrent.futures
 
 # PIP3 modules
-from rich.console import Console
 from rich import print
 from rich.markup import escape
 from rich.panel import Panel
 from rich import box
 
 # Local repo modules
-from cli_colors import Colors
+from cli_colors import Colors, RICH_CONSOLE
 import audio_utils
+import disk_cache
 import llm_wrapper
 import next_song_selector
 import song_details_to_dj_intro
@@ -28,7 +30,35 @@ import prompt_loader
 
 #============================================
 MAX_NEXT_SONG_ATTEMPTS = 5
-RICH_CONSOLE = Console()
+# random draws before the fallback pick gives up on sampling and filters
+FALLBACK_SAMPLE_TRIES = 32
+RETRY_BACKOFF_BASE_SECONDS = 0.1
+RETRY_BACKOFF_MAX_SECONDS = 2.0
+# token overlap above which two intro options count as the same script
+INTRO_AGREEMENT_JACCARD = 0.9
+HISTORY_BUFFER_BYTES = 1 << 16
+HISTORY_SEPARATOR = "-" * 40
+# one next-track prep plus its two intro options, with a spare slot
+DJ_POOL_WORKERS = 4
+# whisper runs are heavy; allow the current and next track to overlap at most
+TRANSCRIBE_POOL_WORKERS = 2
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+# markers that make an intro unusable as spoken text
+_INTRO_TAG_MARKERS = ("<response", "</response")
+_INTRO_FACT_MARKERS = ("fact:", "trivia:")
+# boilerplate phrases the referee likes to pad its reasons with
+_REF_NOISE_RE = re.compile(
+	r"\b(?:specific to the song details|mention(?:s|ing) the (?:band|artist) name|mentioning the song details)\b",
+	re.IGNORECASE,
+)
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# referee prompt budgets: prefill tokens dominate time to first token
+REFEREE_REASON_SENTENCES = 2
+INTRO_REFEREE_DETAILS_CHARS = 1200
+# accepted referee intros, reused when the same song follows the same track again
+INTRO_CACHE_ENDPOINT = "dj_intro"
+INTRO_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
 
 #============================================
 class HistoryLogger:
@@ -37,14 +67,116 @@ class HistoryLogger:
 	"""
 	def __init__(self, path: str = "history.log"):
 		self.path = path
+		# opened on the first entry and kept for the session
+		self._handle = None
+
+	def __enter__(self) -> "HistoryLogger":
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		self.close()
 
 	def log(self, song_path: str, intro_text: str) -> None:
-		line_song = f"SONG: {os.path.basename(song_path)}\n"
-		line_intro = f"INTRO: {intro_text}\n"
-		with open(self.path, "a", encoding="utf-8") as f:
-			f.write(line_song)
-			f.write(line_intro)
-			f.write("-" * 40 + "\n")
+		if self._handle is None:
+			self._handle = open(self.path, "a", encoding="utf-8", buffering=HISTORY_BUFFER_BYTES)
+			atexit.register(self.close)
+		self._handle.write(
+			f"SONG: {os.path.basename(song_path)}\nINTRO: {intro_text}\n{HISTORY_SEPARATOR}\n"
+		)
+		# one write syscall per entry, and a crash never loses a finished entry
+		self._handle.flush()
+
+	def close(self) -> None:
+		if self._handle is not None and not self._handle.closed:
+			self._handle.close()
+
+#============================================
+def _sleep_backoff(attempt: int) -> None:
+	"""
+	Sleep with capped exponential backoff plus jitter after a failed LLM call.
+	"""
+	delay = min(RETRY_BACKOFF_BASE_SECONDS * (2 ** attempt), RETRY_BACKOFF_MAX_SECONDS)
+	time.sleep(delay + random.uniform(0, RETRY_BACKOFF_BASE_SECONDS))
+
+#============================================
+def _token_jaccard(first: str, second: str) -> float:
+	"""
+	Jaccard similarity of the lowercase word sets of two texts.
+	"""
+	first_tokens = set(first.lower().split())
+	second_tokens = set(second.lower().split())
+	union = first_tokens | second_tokens
+	if not union:
+		return 1.0
+	return len(first_tokens & second_tokens) / len(union)
+
+#============================================
+def _estimate_sentence_count(text: str) -> int:
+	"""
+	Count sentence-like fragments of at least three words.
+	"""
+	return sum(1 for part in _SENTENCE_SPLIT_RE.split(text) if len(part.split()) >= 3)
+
+#============================================
+def _intro_verdicts(intro: str) -> tuple[str, str]:
+	"""
+	Check an intro against the strict and relaxed rules in one pass over its text.
+
+	Returns:
+		tuple[str, str]: (strict failure reason, relaxed failure reason); "" means usable.
+	"""
+	if not intro:
+		return ("empty intro", "empty intro")
+	text = intro.strip()
+	lowered = text.lower()
+	if any(marker in lowered for marker in _INTRO_TAG_MARKERS):
+		return ("contains XML tags", "contains XML tags")
+	if any(marker in lowered for marker in _INTRO_FACT_MARKERS):
+		return ("contains FACT/TRIVIA lines", "contains FACT/TRIVIA lines")
+	word_count = len(text.split())
+	sentence_count = _estimate_sentence_count(text)
+
+	relaxed_reason = ""
+	if word_count < 12:
+		relaxed_reason = "too short (<12 words)"
+	elif sentence_count < 2:
+		relaxed_reason = "not enough sentences (<2)"
+
+	strict_reason = ""
+	if len(text) < 200:
+		strict_reason = "too short (<200 chars)"
+	elif word_count < 30:
+		strict_reason = "too short (<30 words)"
+	elif sentence_count < 3:
+		strict_reason = "not enough sentences (<3)"
+	return (strict_reason, relaxed_reason)
+
+#============================================
+def _first_sentences(text: str, count: int) -> str:
+	"""
+	Keep only the first few sentences of a block of text.
+	"""
+	return " ".join(_SENTENCE_END_RE.split(text.strip(), maxsplit=count)[:count])
+
+#============================================
+def _trim_details(details_text: str, max_chars: int) -> str:
+	"""
+	Cut song details to a character budget, ending on a whole line when possible.
+	"""
+	if len(details_text) <= max_chars:
+		return details_text
+	cut = details_text.rfind("\n", 0, max_chars)
+	return details_text[:cut if cut > 0 else max_chars].rstrip()
+
+#============================================
+def _intro_cache_query(song: audio_utils.Song, prev_song: audio_utils.Song | None, model_name: str | None) -> str:
+	"""
+	Build the intro cache query from the song, the model, and the previous track.
+	"""
+	song_key = f"{song.artist}|{song.title}" if audio_utils.has_real_tags(song) else song.path
+	# the intro prompt names the previous file and title, so key on that exact track
+	prev_key = prev_song.path if prev_song else ""
+	return f"{song_key}|{model_name or 'afm'}|{prev_key}"
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -54,6 +186,7 @@ def parse_args() -> argparse.Namespace:
 	parser.add_argument("-r", "--tts-speed", dest="tts_speed", type=float, default=1.2, help="Playback speed multiplier for the DJ intro.")
 	parser.add_argument("--tts-engine", choices=["say", "gtts", "pyttsx3"], default="say", help="TTS engine to use for DJ intros (default: macOS say).")
 	parser.add_argument("-t", "--testing", dest="testing", action="store_true", help="Testing mode: play only the first 20 seconds of each song.")
+	parser.add_argument("--verbose-candidates", dest="verbose_candidates", action="store_true", help="Print each candidate pool offered to the next-song selector.")
 	return parser.parse_args()
 
 #============================================
@@ -68,14 +201,58 @@ class DiscJockey:
 		self.queued_intro: str | None = None
 		self.queued_intro_audio: str | None = None
 		self.previous_song: audio_utils.Song | None = None
+		# paths of the last printed candidate pool, so retries on the same pool stay quiet
+		self._last_pool_key: tuple[str, ...] | None = None
+		# the prep worker writes the next-track fields while the main thread speaks
+		self._next_lock = threading.Lock()
+		# reuse worker threads across tracks instead of spawning new ones per song
+		self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=DJ_POOL_WORKERS, thread_name_prefix="dj")
+		atexit.register(self._pool.shutdown, wait=False, cancel_futures=True)
+		# lyrics transcriptions started early, keyed by song path
+		self._transcribe_pool = concurrent.futures.ThreadPoolExecutor(
+			max_workers=TRANSCRIBE_POOL_WORKERS, thread_name_prefix="dj-lyrics"
+		)
+		atexit.register(self._transcribe_pool.shutdown, wait=False, cancel_futures=True)
+		self._transcribe_futures: dict[str, concurrent.futures.Future] = {}
+		self._transcribe_lock = threading.Lock()
 		self.history = HistoryLogger()
 		self.model_name = llm_wrapper.get_default_model_name()
 		tts_helpers.DEFAULT_ENGINE = args.tts_engine
+		# load the model and open audio output while the first intro gathers song details
+		threading.Thread(target=llm_wrapper.warm_up_model, args=(self.model_name,), daemon=True).start()
+		threading.Thread(target=tts_helpers.warm_up, daemon=True).start()
+		self._prefetch_lyrics(self.current_song)
 
 	#============================================
 	def log_intro(self, song: audio_utils.Song, intro: str) -> None:
 		self.history.log(song.path, intro)
 
+	#============================================
+	def _prefetch_lyrics(self, song: audio_utils.Song) -> None:
+		"""
+		Start transcribing a song's lyrics in the background if not already running.
+		"""
+		with self._transcribe_lock:
+			if song.path not in self._transcribe_futures:
+				self._transcribe_futures[song.path] = self._transcribe_pool.submit(
+					transcribe_audio.transcribe_audio, song.path
+				)
+
+	#============================================
+	def _take_lyrics(self, song: audio_utils.Song) -> str | None:
+		"""
+		Return prefetched lyrics for a song, transcribing now when none were started.
+		"""
+		with self._transcribe_lock:
+			future = self._transcribe_futures.pop(song.path, None)
+		if future is None:
+			return transcribe_audio.transcribe_audio(song.path)
+		try:
+			return future.result()
+		except Exception as error:
+			print(f"{Colors.WARNING}Lyrics transcription failed: {escape(str(error))}{Colors.ENDC}")
+			return None
+
 	#============================================
 	def choose_next(self, last_song: audio_utils.Song) -> audio_utils.Song | None:
 		last_candidates = []
@@ -90,38 +267,39 @@ class DiscJockey:
 					f"{Colors.WARNING}No candidate songs available "
 					f"(attempt {attempt + 1}/{MAX_NEXT_SONG_ATTEMPTS}); retrying selection.{Colors.ENDC}"
 				)
-				time.sleep(1)
 				continue
 
 			last_candidates = candidates
 			self._print_candidate_pool(candidates)
-			first_result = next_song_selector.choose_next_song(
-				last_song,
-				self.song_paths,
-				self.args.sample_size,
-				self.model_name,
-				candidates=candidates,
-				show_candidates=False,
-			)
-			second_result = next_song_selector.choose_next_song(
-				last_song,
-				self.song_paths,
-				self.args.sample_size,
-				self.model_name,
-				candidates=candidates,
-				show_candidates=False,
-			)
+			# one request returns both picks, so the prompt prefill is shared
+			try:
+				first_result, second_result = next_song_selector.choose_two_next_songs(
+					last_song,
+					self.song_paths,
+					self.args.sample_size,
+					self.model_name,
+					candidates=candidates,
+				)
+			except Exception as error:
+				# only a failed LLM call is worth waiting on; bad picks retry at once
+				print(f"{Colors.WARNING}Selector LLM call failed: {escape(str(error))}; backing off.{Colors.ENDC}")
+				_sleep_backoff(attempt)
+				continue
+			if first_result is None or second_result is None:
+				print(f"{Colors.WARNING}Selector LLM returned no reply; backing off.{Colors.ENDC}")
+				_sleep_backoff(attempt)
+				continue
 
 			first_song = first_result.song
 			second_song = second_result.song
 
 			if first_song and second_song:
 				if first_song.path == second_song.path:
-					file_name = escape(os.path.basename(first_song.path))
+					file_name = escape(first_song.basename)
 					print(f"{Colors.OKGREEN}Both selectors picked {file_name}; accepting unanimous choice.{Colors.ENDC}")
 					return first_song
 
-				best_result = self._run_referee(last_song, candidates, [("A", first_result), ("B", second_result)])
+				best_result = self._run_referee(last_song, [("A", first_result), ("B", second_result)])
 				if best_result and best_result.song:
 					return best_result.song
 
@@ -129,13 +307,12 @@ class DiscJockey:
 					f"{Colors.WARNING}Referee could not pick a winner "
 					f"(attempt {attempt + 1}/{MAX_NEXT_SONG_ATTEMPTS}); retrying selection.{Colors.ENDC}"
 				)
-				time.sleep(1)
 				continue
 
 			if first_song or second_song:
 				chosen = first_song or second_song
 				source = "first" if first_song else "second"
-				file_name = escape(os.path.basename(chosen.path))
+				file_name = escape(chosen.basename)
 				print(f"{Colors.OKGREEN}Only {source} selector produced a song; using {file_name}.{Colors.ENDC}")
 				return chosen
 
@@ -143,7 +320,6 @@ class DiscJockey:
 				f"{Colors.WARNING}Neither selector produced a song "
 				f"(attempt {attempt + 1}/{MAX_NEXT_SONG_ATTEMPTS}); retrying selection.{Colors.ENDC}"
 			)
-			time.sleep(1)
 
 		return self._fallback_next_song(last_song, last_candidates)
 
@@ -158,63 +334,86 @@ class DiscJockey:
 		"""
 		if candidates:
 			chosen = random.choice(candidates)
-			file_name = escape(os.path.basename(chosen.path))
+			file_name = escape(chosen.basename)
 			print(f"{Colors.WARNING}Falling back to random candidate: {file_name}{Colors.ENDC}")
 			return chosen
 
-		other_paths = [path for path in self.song_paths if path != last_song.path]
-		if not other_paths:
+		chosen_path = None
+		if len(self.song_paths) > 1:
+			# rejection sampling avoids copying the whole library for one pick
+			for _ in range(FALLBACK_SAMPLE_TRIES):
+				path = random.choice(self.song_paths)
+				if path != last_song.path:
+					chosen_path = path
+					break
+			else:
+				# duplicate paths can defeat sampling; filter once as a last resort
+				other_paths = [path for path in self.song_paths if path != last_song.path]
+				if other_paths:
+					chosen_path = random.choice(other_paths)
+		if chosen_path is None:
 			print(f"{Colors.FAIL}No fallback songs available; ending session.{Colors.ENDC}")
 			return None
 
-		chosen_path = random.choice(other_paths)
 		chosen = audio_utils.Song(chosen_path)
-		file_name = escape(os.path.basename(chosen.path))
+		file_name = escape(chosen.basename)
 		print(f"{Colors.WARNING}Falling back to random library pick: {file_name}{Colors.ENDC}")
 		return chosen
 
 	#============================================
 	def prepare_next_async(self, last_song: audio_utils.Song) -> None:
+		"""
+		Pick the next song and render its intro into the queued fields.
+		"""
+		next_song, intro, intro_audio = self._prepare_next(last_song)
+		with self._next_lock:
+			self.next_song = next_song
+			self.queued_intro = intro
+			self.queued_intro_audio = intro_audio
+
+	#============================================
+	def _prepare_next(self, last_song: audio_utils.Song) -> tuple:
 		next_song = self.choose_next(last_song)
 		if not next_song:
 			print(f"{Colors.FAIL}No next song available after retries; ending session.{Colors.ENDC}")
-			self.next_song = None
-			self.queued_intro = None
-			self.queued_intro_audio = None
-			return
-		file_name = escape(os.path.basename(next_song.path))
+			return None, None, None
+		file_name = escape(next_song.basename)
 		print(f"{Colors.OKBLUE}Preparing next song: {file_name}{Colors.ENDC}")
-		self.queued_intro = self._generate_intro(
+		intro = self._generate_intro(
 			next_song,
 			prev_song=last_song,
 			use_referee=True,
 		)
-		self.queued_intro_audio = None
-		if self.queued_intro:
+		intro_audio = None
+		if intro:
 			print(f"{Colors.OKBLUE}Pre-rendering intro audio for next track...{Colors.ENDC}")
-			self.queued_intro_audio = tts_helpers.render_dj_intro_audio(
-				self.queued_intro,
+			# each render gets its own temp file, so it never clobbers the intro being played
+			intro_audio = tts_helpers.synthesize_dj_intro(
+				intro,
 				self.args.tts_speed,
 				engine=self.args.tts_engine,
-				output_path=os.path.join("output", "queued_intro.wav"),
 			)
-			if self.queued_intro_audio:
+			if intro_audio:
 				print(f"{Colors.OKGREEN}Queued intro audio ready.{Colors.ENDC}")
 			else:
 				print(f"{Colors.WARNING}Queued intro audio generation failed; will render on demand.{Colors.ENDC}")
-		self.next_song = next_song
+		return next_song, intro, intro_audio
 
 	#============================================
-	def prepare_and_speak_intro(self, song: audio_utils.Song, use_queue: bool) -> None:
+	def prepare_and_speak_intro(
+		self,
+		song: audio_utils.Song,
+		queued_intro: str | None = None,
+		queued_intro_audio: str | None = None,
+	) -> None:
 		max_attempts = 2
 		intro_text: str | None = None
 		use_cached_audio = False
 		for attempt in range(max_attempts):
-			using_queue = attempt == 0 and use_queue and self.queued_intro
+			using_queue = attempt == 0 and queued_intro
 			if using_queue:
-				intro_text = self.queued_intro
-				use_cached_audio = bool(self.queued_intro_audio)
-				self.queued_intro = None
+				intro_text = queued_intro
+				use_cached_audio = bool(queued_intro_audio)
 				print(f"{Colors.OKCYAN}Using queued intro for current track.{Colors.ENDC}")
 			else:
 				if attempt > 0:
@@ -255,176 +454,149 @@ class DiscJockey:
 					panel_text,
 					title="DJ Introduction",
 					title_align="left",
-					border_style="#7b12a1",
+					border_style="dj_panel",
 					box=box.DOUBLE,
 				)
 			)
 			try:
-				if use_cached_audio and self.queued_intro_audio:
-					tts_helpers.play_rendered_intro(self.queued_intro_audio, intro_text)
+				if use_cached_audio and queued_intro_audio:
+					tts_helpers.play_dj_intro(queued_intro_audio, intro_text)
 				else:
 					tts_helpers.speak_dj_intro(intro_text, self.args.tts_speed, engine=self.args.tts_engine)
 			except Exception as error:
 				print(f"{Colors.FAIL}TTS playback failed: {escape(str(error))}{Colors.ENDC}")
 			self.log_intro(song, intro_text)
-			self.queued_intro_audio = None
 		else:
 			print(f"{Colors.FAIL}No usable intro text after retries; skipping TTS.{Colors.ENDC}")
 
-	#============================================
-	def queue_next_intro(self, next_song: audio_utils.Song | None) -> None:
-		if not next_song:
-			print(f"{Colors.WARNING}No next song available to prepare.{Colors.ENDC}")
-			return
-		file_name = escape(os.path.basename(next_song.path))
-		print(f"{Colors.OKBLUE}Preparing next song: {file_name}{Colors.ENDC}")
-		self.queued_intro = self._generate_intro(
-			next_song,
-			prev_song=self.current_song,
-			use_referee=True,
-		)
-		self.queued_intro_audio = None
-		if self.queued_intro:
-			print(f"{Colors.OKBLUE}Pre-rendering intro audio for next track...{Colors.ENDC}")
-			self.queued_intro_audio = tts_helpers.render_dj_intro_audio(
-				self.queued_intro,
-				self.args.tts_speed,
-				engine=self.args.tts_engine,
-				output_path=os.path.join("output", "queued_intro.wav"),
-			)
-			if self.queued_intro_audio:
-				print(f"{Colors.OKGREEN}Queued intro audio ready.{Colors.ENDC}")
-			else:
-				print(f"{Colors.WARNING}Queued intro audio generation failed; will render on demand.{Colors.ENDC}")
-
 	#============================================
 	def run(self) -> None:
 		print(f"{Colors.WARNING}Found {len(self.song_paths)} audio files in {self.args.directory}.{Colors.ENDC}")
-		start_name = escape(os.path.basename(self.current_song.path))
+		start_name = escape(self.current_song.basename)
 		print(f"{Colors.OKGREEN}Starting with user-selected song: {start_name}{Colors.ENDC}")
 
 		while True:
-			self.prepare_and_speak_intro(self.current_song, use_queue=True)
-			playback_helpers.play_song(self.current_song)
-
-			# Prepare next song and intro concurrently while current is playing
-			self.next_song = None
-			self.queued_intro = None
-			self.queued_intro_audio = None
-			next_thread = threading.Thread(target=self.prepare_next_async, args=(self.current_song,))
-			next_thread.start()
+			# take this track's queued intro before the worker starts filling in the next one
+			with self._next_lock:
+				queued_intro = self.queued_intro
+				queued_intro_audio = self.queued_intro_audio
+				self.next_song = None
+				self.queued_intro = None
+				self.queued_intro_audio = None
+			# pick the next song while this intro is spoken and the song plays
+			next_future = self._pool.submit(self.prepare_next_async, self.current_song)
 
+			self.prepare_and_speak_intro(self.current_song, queued_intro, queued_intro_audio)
+			playback_helpers.play_song(self.current_song)
 			playback_helpers.wait_for_song_end(self.args.testing)
-			next_thread.join()
+			next_future.result()
 
-			if not self.next_song:
+			with self._next_lock:
+				next_song = self.next_song
+				next_intro = self.queued_intro
+				next_intro_audio = self.queued_intro_audio
+			if not next_song:
 				print(f"{Colors.FAIL}No next song available. Ending session.{Colors.ENDC}")
 				break
 
-			if self.queued_intro and len(self.queued_intro.strip()) > 5:
+			if next_intro and len(next_intro.strip()) > 5:
 				print(f"{Colors.OKGREEN}Queued intro ready for next track.{Colors.ENDC}")
-				if self.queued_intro_audio:
+				if next_intro_audio:
 					print(f"{Colors.OKGREEN}Queued intro audio ready for next track.{Colors.ENDC}")
 			else:
 				print(f"{Colors.WARNING}Next intro missing or too short; will skip TTS for next track.{Colors.ENDC}")
 
 			# Handoff to the next track
 			self.previous_song = self.current_song
-			self.current_song = self.next_song
-			self.next_song = None
+			self.current_song = next_song
 
 	#============================================
 	def _generate_intro(self, song: audio_utils.Song, prev_song: audio_utils.Song | None, use_referee: bool) -> str | None:
 		if use_referee:
-			return self._generate_intro_with_referee(song, prev_song)
+			query = _intro_cache_query(song, prev_song, self.model_name)
+			cached = disk_cache.get_response(INTRO_CACHE_ENDPOINT, query, INTRO_CACHE_MAX_AGE_SECONDS)
+			if cached is not None:
+				print(f"{Colors.OKGREEN}Reusing cached intro for {escape(song.basename)}.{Colors.ENDC}")
+				return cached.decode("utf-8")
+			intro = self._generate_intro_with_referee(song, prev_song)
+			if intro:
+				disk_cache.store_response(INTRO_CACHE_ENDPOINT, query, intro.encode("utf-8"))
+			return intro
+		# an empty string keeps prepare_intro_text from transcribing a second time
 		return song_details_to_dj_intro.prepare_intro_text(
 			song,
 			prev_song=prev_song,
 			model_name=self.model_name,
+			lyrics_text=self._take_lyrics(song) or "",
 		)
 
+	#============================================
+	def _generate_one_intro(
+		self,
+		label: str,
+		song: audio_utils.Song,
+		prev_song: audio_utils.Song | None,
+		details_text: str,
+		lyrics_text: str | None,
+	) -> tuple[str, bool]:
+		"""
+		Generate one intro option with retries.
+
+		Returns:
+			tuple[str, bool]: (intro text or "", accepted only under relaxed validation).
+		"""
+		print(f"{Colors.OKBLUE}Generating DJ intro option {label}...{Colors.ENDC}")
+		max_intro_attempts = 2
+		for attempt in range(max_intro_attempts):
+			intro = song_details_to_dj_intro.prepare_intro_text(
+				song,
+				prev_song=prev_song,
+				model_name=self.model_name,
+				details_text=details_text,
+				lyrics_text=lyrics_text,
+			)
+			if not intro:
+				print(f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} rejected: empty intro{Colors.ENDC}")
+				continue
+			intro = intro.strip()
+			reason, relaxed_reason = _intro_verdicts(intro)
+			if not reason:
+				return intro, False
+			if not relaxed_reason:
+				print(
+					f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} "
+					f"accepted with relaxed validation: {escape(reason)}{Colors.ENDC}"
+				)
+				return intro, True
+			print(f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} rejected: {escape(reason)}{Colors.ENDC}")
+		return "", False
+
 	#============================================
 	def _generate_intro_with_referee(self, song: audio_utils.Song, prev_song: audio_utils.Song | None) -> str | None:
+		file_name = escape(song.basename)
+		print(f"{Colors.OKBLUE}Transcribing lyrics for {file_name}...{Colors.ENDC}")
+		# whisper runs in the background while the details lookup waits on the network
+		self._prefetch_lyrics(song)
 		try:
 			details_text = song_details_to_dj_intro.fetch_song_details(song)
 		except Exception as error:
 			print(f"{Colors.WARNING}Failed to fetch song details for intro referee: {escape(str(error))}{Colors.ENDC}")
+			# the prefetched lyrics stay queued for the on-demand intro path
 			return None
 
-		lyrics_text = None
-		file_name = escape(os.path.basename(song.path))
-		print(f"{Colors.OKBLUE}Transcribing lyrics for {file_name}...{Colors.ENDC}")
-		lyrics_text = transcribe_audio.transcribe_audio(song.path)
-
-		def _estimate_sentence_count(text: str) -> int:
-			parts = re.split(r"[.!?]+", text)
-			sentences = 0
-			for part in parts:
-				words = part.strip().split()
-				if len(words) >= 3:
-					sentences += 1
-			return sentences
-
-		def _is_intro_usable(intro: str, relaxed: bool = False) -> tuple[bool, str]:
-			if not intro:
-				return (False, "empty intro")
-			text = intro.strip()
-			lowered = text.lower()
-			if "<response" in lowered or "</response" in lowered:
-				return (False, "contains XML tags")
-			if "fact:" in lowered or "trivia:" in lowered:
-				return (False, "contains FACT/TRIVIA lines")
-			sentence_count = _estimate_sentence_count(text)
-			if relaxed:
-				if len(text.split()) < 12:
-					return (False, "too short (<12 words)")
-				if sentence_count < 2:
-					return (False, "not enough sentences (<2)")
-			else:
-				if len(text) < 200:
-					return (False, "too short (<200 chars)")
-				if len(text.split()) < 30:
-					return (False, "too short (<30 words)")
-				if sentence_count < 3:
-					return (False, "not enough sentences (<3)")
+		lyrics_text = self._take_lyrics(song)
 
-			return (True, "")
+		# the two options are independent LLM calls, so generate them side by side
+		futures = [
+			(label, self._pool.submit(self._generate_one_intro, label, song, prev_song, details_text, lyrics_text))
+			for label in ("A", "B")
+		]
+		results = [(label, future.result()) for label, future in futures]
 
 		candidates: list[tuple[str, str]] = []
 		relaxed_candidates: list[tuple[str, str]] = []
-		for label in ("A", "B"):
-			print(f"{Colors.OKBLUE}Generating DJ intro option {label}...{Colors.ENDC}")
-			max_intro_attempts = 2
-			intro = ""
-			accepted_relaxed = False
-			for attempt in range(max_intro_attempts):
-				intro = song_details_to_dj_intro.prepare_intro_text(
-					song,
-					prev_song=prev_song,
-					model_name=self.model_name,
-					details_text=details_text,
-					lyrics_text=lyrics_text,
-				)
-				if not intro:
-					print(f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} rejected: empty intro{Colors.ENDC}")
-					intro = ""
-					continue
-				intro = intro.strip()
-				ok, reason = _is_intro_usable(intro, relaxed=False)
-				if ok:
-					accepted_relaxed = False
-					break
-				ok_relaxed, _ = _is_intro_usable(intro, relaxed=True)
-				if ok_relaxed:
-					accepted_relaxed = True
-					print(
-						f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} "
-						f"accepted with relaxed validation: {escape(reason)}{Colors.ENDC}"
-					)
-					break
-				print(f"{Colors.WARNING}Intro option {label} attempt {attempt + 1} rejected: {escape(reason)}{Colors.ENDC}")
-				intro = ""
-
+		# print both options in label order once they are done
+		for label, (intro, accepted_relaxed) in results:
 			if intro:
 				print(f"{Colors.OKMAGENTA}Intro Option {label}:{Colors.ENDC}\n{escape(intro)}\n{'-'*60}")
 				if accepted_relaxed:
@@ -447,7 +619,14 @@ class DiscJockey:
 			print(f"{Colors.WARNING}Only option {candidates[0][0]} produced text; using it by default.{Colors.ENDC}")
 			return candidates[0][1]
 
-		best_intro = self._run_intro_referee(song, prev_song, candidates, details_text)
+		first_intro = candidates[0][1]
+		second_intro = candidates[1][1]
+		if first_intro == second_intro or _token_jaccard(first_intro, second_intro) > INTRO_AGREEMENT_JACCARD:
+			print(f"{Colors.OKGREEN}Both intros agreed; skipping referee.{Colors.ENDC}")
+			best_intro = first_intro
+		else:
+			best_intro = self._run_intro_referee(song, prev_song, candidates, details_text)
+
 		if best_intro:
 			polished = song_details_to_dj_intro.polish_intro_for_reading(
 				best_intro,
@@ -467,14 +646,11 @@ class DiscJockey:
 		candidates: list[tuple[str, str]],
 		details_text: str,
 	) -> str:
-		options_block = ""
-		for label, text in candidates:
-			options_block += f"\nOption {label} intro:\n{text}\n"
+		options_block = "".join(f"\nOption {label} intro:\n{text}\n" for label, text in candidates)
 
 		previous_section = ""
 		if prev_song:
-			previous_section = "(***) Previous song summary:\n"
-			previous_section += prev_song.one_line_info() + "\n"
+			previous_section = f"(***) Previous song summary:\n{prev_song.one_line_info()}\n"
 
 		template = prompt_loader.load_prompt("dj_intro_referee.txt")
 		prompt = prompt_loader.render_prompt(
@@ -482,14 +658,15 @@ class DiscJockey:
 			{
 				"current_song_summary": song.one_line_info(),
 				"previous_song_section": previous_section,
-				"details_text": details_text,
+				"details_text": _trim_details(details_text, INTRO_REFEREE_DETAILS_CHARS),
 				"options_block": options_block,
 			},
 		)
 
 		raw = llm_wrapper.run_llm(prompt, model_name=self.model_name)
-		winner_text = llm_wrapper.extract_xml_tag(raw, "winner")
-		ref_reason = llm_wrapper.extract_xml_tag(raw, "reason")
+		tags = llm_wrapper.extract_xml_tags(raw, ["winner", "reason"])
+		winner_text = tags.get("winner", "")
+		ref_reason = tags.get("reason", "")
 
 		if ref_reason:
 			clean_reason = self._clean_referee_reason(ref_reason)
@@ -521,30 +698,25 @@ class DiscJockey:
 	def _clean_referee_reason(self, reason: str) -> str:
 		if not reason:
 			return ""
-		cleaned = reason.strip()
-		cleaned = re.sub(r"\bspecific to the song details\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\bmentions the band name\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\bmentioning the band name\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\bmentioning the artist name\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\bmentions the artist name\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\bmentioning the song details\b", "", cleaned, flags=re.IGNORECASE)
-		cleaned = re.sub(r"\s{2,}", " ", cleaned).strip(" ,.-")
+		cleaned = _REF_NOISE_RE.sub("", reason.strip())
+		cleaned = _MULTI_SPACE_RE.sub(" ", cleaned).strip(" ,.-")
 		return cleaned
 
 	#============================================
 	def _print_candidate_pool(self, candidates: list[audio_utils.Song]) -> None:
-		print(f"{Colors.OKMAGENTA}Candidates for next song:{Colors.ENDC}")
-		lines = []
-		for song in candidates:
-			lines.append(song.one_line_info(color=True))
-		lines.sort()
-		print('\n'.join(lines))
+		if not self.args.verbose_candidates:
+			return
+		pool_key = tuple(song.path for song in candidates)
+		if pool_key == self._last_pool_key:
+			return
+		self._last_pool_key = pool_key
+		RICH_CONSOLE.print("Candidates for next song:", style="okmagenta")
+		RICH_CONSOLE.print(audio_utils.format_song_lines(candidates, color=True))
 
 	#============================================
 	def _run_referee(
 		self,
 		current_song: audio_utils.Song,
-		candidates: list[audio_utils.Song],
 		results: list[tuple[str, next_song_selector.SelectionResult]],
 	) -> next_song_selector.SelectionResult | None:
 		valid = [(label, result) for (label, result) in results if result.song]
@@ -555,23 +727,19 @@ class DiscJockey:
 			print(f"{Colors.WARNING}Only option {label} yielded a song; rerunning the duel.{Colors.ENDC}")
 			return None
 
-		candidate_lines = []
-		for song in candidates:
-			candidate_lines.append(
-				f"- {os.path.basename(song.path)} | Artist: {song.artist} | Album: {song.album} | Title: {song.title}"
-			)
-
+		# the prompt does not change between attempts, so build it once
+		prompt = self._build_referee_prompt(current_song, results)
 		max_attempts = 2
 		for attempt in range(max_attempts):
-			prompt = self._build_referee_prompt(current_song, candidate_lines, results)
 			raw = llm_wrapper.run_llm(prompt, model_name=self.model_name)
 			raw_output = raw.strip() if raw else ""
-			winner_text = llm_wrapper.extract_xml_tag(raw, "winner")
-			ref_reason = llm_wrapper.extract_xml_tag(raw, "reason")
+			tags = llm_wrapper.extract_xml_tags(raw, ["winner", "reason"])
+			winner_text = tags.get("winner", "")
+			ref_reason = tags.get("reason", "")
 
 			resolved = self._resolve_referee_winner(winner_text, valid)
 			if resolved and resolved.song:
-				file_name = escape(os.path.basename(resolved.song.path))
+				file_name = escape(resolved.song.basename)
 				print(f"{Colors.OKCYAN}Referee selected: {file_name}{Colors.ENDC}")
 				if ref_reason:
 					print(f"{Colors.OKGREEN}Referee reason: {ref_reason}{Colors.ENDC}")
@@ -588,23 +756,27 @@ class DiscJockey:
 	def _build_referee_prompt(
 		self,
 		current_song: audio_utils.Song,
-		candidate_lines: list[str],
 		results: list[tuple[str, next_song_selector.SelectionResult]],
 	) -> str:
-		options_block = ""
+		"""
+		Build the selector referee prompt from the two picks alone; the full pool is not repeated.
+		"""
+		parts: list[str] = []
 		for label, result in results:
 			if not result.song:
-				options_block += f"\nOption {label}: No selection returned.\n"
+				parts.append(f"\nOption {label}: No selection returned.\n")
 				continue
 			target = result.song
-			reason_text = result.reason.strip() if result.reason else "No reasoning provided."
-			options_block += (
-				f"\nOption {label}: {os.path.basename(target.path)} | Artist: {target.artist} | Album: {target.album}\n"
+			reason_text = _first_sentences(result.reason, REFEREE_REASON_SENTENCES) if result.reason else ""
+			reason_text = reason_text or "No reasoning provided."
+			parts.append(
+				f"\nOption {label}: {target.basename} | Artist: {target.artist} | Album: {target.album}\n"
 				f"Selector rationale:\n{reason_text}\n"
 			)
+		options_block = "".join(parts)
 
 		current_song_line = (
-			f"{os.path.basename(current_song.path)} | "
+			f"{current_song.basename} | "
 			f"Artist: {current_song.artist} | Album: {current_song.album} | Title: {current_song.title}"
 		)
 
@@ -613,7 +785,6 @@ class DiscJockey:
 			template,
 			{
 				"current_song_line": current_song_line,
-				"candidate_lines": "\n".join(candidate_lines),
 				"options_block": options_block,
 			},
 		)
@@ -653,7 +824,7 @@ class DiscJockey:
 		for _, result in valid_results:
 			if not result.song:
 				continue
-			file_name = os.path.basename(result.song.path)
+			file_name = result.song.basename
 			if cleaned and cleaned == result.choice_text.lower():
 				return result
 			if cleaned and cleaned == file_name.lower():
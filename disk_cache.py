@@ -0,0 +1,148 @@
+# Standard Library
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+import subprocess
+
+#============================================
+CACHE_FILENAME = "lookup_cache.sqlite3"
+# empty means <repo>/output/lookup_cache.sqlite3, resolved on first use
+CACHE_PATH = os.environ.get("DJ_CACHE_PATH", "")
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+_CONNECTION = None
+_LOCK = threading.Lock()
+
+#============================================
+def _repo_root() -> str:
+	"""
+	Resolve the repository root with git, anchored at this module's directory.
+	"""
+	module_dir = os.path.dirname(os.path.abspath(__file__))
+	try:
+		result = subprocess.run(
+			["git", "-C", module_dir, "rev-parse", "--show-toplevel"],
+			capture_output=True,
+			text=True,
+			check=False,
+		)
+	except OSError:
+		return module_dir
+	root = result.stdout.strip()
+	# copies outside a git checkout keep the cache next to the module
+	if result.returncode != 0 or not root:
+		return module_dir
+	return root
+
+#============================================
+def _default_cache_path() -> str:
+	"""
+	Path of the cache database under the repo output folder.
+	"""
+	return os.path.join(_repo_root(), "output", CACHE_FILENAME)
+
+#============================================
+def _get_connection() -> sqlite3.Connection:
+	"""
+	Open the cache database once and create the tables on first use.
+	"""
+	global _CONNECTION
+	if _CONNECTION is not None:
+		return _CONNECTION
+	cache_path = CACHE_PATH or _default_cache_path()
+	cache_dir = os.path.dirname(cache_path)
+	if cache_dir:
+		os.makedirs(cache_dir, exist_ok=True)
+	# lookups run in worker threads, access is serialized with _LOCK
+	connection = sqlite3.connect(cache_path, check_same_thread=False)
+	connection.execute("PRAGMA journal_mode=WAL")
+	connection.execute("PRAGMA synchronous=NORMAL")
+	connection.execute(
+		"CREATE TABLE IF NOT EXISTS responses "
+		"(key TEXT PRIMARY KEY, body BLOB, fetched_at INTEGER)"
+	)
+	connection.execute(
+		"CREATE TABLE IF NOT EXISTS songs "
+		"(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, title TEXT, artist TEXT, "
+		"album TEXT, year TEXT, length_seconds INTEGER, is_compilation INTEGER)"
+	)
+	connection.commit()
+	_CONNECTION = connection
+	return connection
+
+#============================================
+def make_key(endpoint: str, query: str) -> str:
+	"""
+	Build the cache key for an endpoint and query string.
+	"""
+	return hashlib.sha1(f"{endpoint}|{query}".encode("utf-8")).hexdigest()
+
+#============================================
+def get_response(endpoint: str, query: str, max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS) -> bytes | None:
+	"""
+	Return a cached response body, or None when missing or expired.
+	"""
+	oldest = int(time.time()) - max_age_seconds
+	with _LOCK:
+		row = _get_connection().execute(
+			"SELECT body FROM responses WHERE key=? AND fetched_at > ?",
+			(make_key(endpoint, query), oldest),
+		).fetchone()
+	if row is None:
+		return None
+	return row[0]
+
+#============================================
+def store_response(endpoint: str, query: str, body: bytes) -> None:
+	"""
+	Store a response body for an endpoint and query string.
+	"""
+	with _LOCK:
+		connection = _get_connection()
+		connection.execute(
+			"INSERT OR REPLACE INTO responses (key, body, fetched_at) VALUES (?, ?, ?)",
+			(make_key(endpoint, query), body, int(time.time())),
+		)
+		connection.commit()
+
+#============================================
+def get_song_info(path: str, mtime_ns: int, size: int) -> dict | None:
+	"""
+	Return cached tag fields for a file, or None when the file changed or is unknown.
+	"""
+	with _LOCK:
+		row = _get_connection().execute(
+			"SELECT title, artist, album, year, length_seconds, is_compilation "
+			"FROM songs WHERE path=? AND mtime_ns=? AND size=?",
+			(path, mtime_ns, size),
+		).fetchone()
+	if row is None:
+		return None
+	info = {
+		"title": row[0],
+		"artist": row[1],
+		"album": row[2],
+		"year": row[3],
+		"length_seconds": row[4],
+		"is_compilation": bool(row[5]),
+	}
+	return info
+
+#============================================
+def store_song_info(path: str, mtime_ns: int, size: int, info: dict) -> None:
+	"""
+	Store tag fields for a file keyed by its path, mtime, and size.
+	"""
+	with _LOCK:
+		connection = _get_connection()
+		connection.execute(
+			"INSERT OR REPLACE INTO songs (path, mtime_ns, size, title, artist, album, "
+			"year, length_seconds, is_compilation) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+			(
+				path, mtime_ns, size, info["title"], info["artist"], info["album"],
+				info["year"], info["length_seconds"], int(info["is_compilation"]),
+			),
+		)
+		connection.commit()
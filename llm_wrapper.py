@@ -3,9 +3,11 @@ import re
 import time
 import hashlib
 import datetime
+import threading
 import subprocess
 
 # PIP3 modules
+import requests
 from rich import print
 from rich.markup import escape
 
@@ -14,6 +16,28 @@ from cli_colors import Colors
 
 #============================================
 LLM_LOG_PATH = os.path.join("output", "llm_responses.log")
+# run_llm may be called from several threads; keep each log entry contiguous
+_LOG_LOCK = threading.Lock()
+# models already loaded by warm_up_model in this process
+_WARMED_MODELS = set()
+_WARM_LOCK = threading.Lock()
+WARM_UP_TIMEOUT_SECONDS = 300
+# Ollama HTTP API; OLLAMA_HOST follows the ollama CLI convention
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_HOST", "127.0.0.1:11434").strip().rstrip("/")
+if not OLLAMA_BASE_URL.startswith(("http://", "https://")):
+	OLLAMA_BASE_URL = "http://" + OLLAMA_BASE_URL
+# keep the model resident between the A/B selector and intro calls
+OLLAMA_KEEP_ALIVE = "30m"
+OLLAMA_REQUEST_TIMEOUT_SECONDS = 600
+OLLAMA_PROBE_TIMEOUT_SECONDS = 1.0
+# one pooled session keeps the daemon connection open across calls
+_OLLAMA_SESSION = requests.Session()
+# None until probed; False falls back to the ollama CLI until the next probe
+_ollama_api_up = None
+_ollama_probed_at = 0.0
+OLLAMA_REPROBE_SECONDS = 60
+# any closed <tag>...</tag> pair, matched in one pass by extract_xml_tags
+_XML_PAIR_RE = re.compile(r"<(\w+)>(.*?)</\1>", re.DOTALL | re.IGNORECASE)
 
 #============================================
 def _log_llm_exchange(
@@ -35,7 +59,7 @@ def _log_llm_exchange(
 		prompt_text = prompt or ""
 		response_text = response or ""
 		prompt_hash = hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()
-		with open(LLM_LOG_PATH, "a", encoding="utf-8") as handle:
+		with _LOG_LOCK, open(LLM_LOG_PATH, "a", encoding="utf-8") as handle:
 			handle.write("=" * 72 + "\n")
 			handle.write(f"Timestamp: {timestamp}\n")
 			handle.write(f"Backend: {backend}\n")
@@ -94,6 +118,28 @@ def extract_xml_tag(raw_text: str, tag: str) -> str:
 	content = raw_text[gt_idx + 1 : close_idx]
 	return content.strip()
 
+#============================================
+def extract_xml_tags(raw_text: str, names: list[str]) -> dict[str, str]:
+	"""
+	Extract the last occurrence of several tags in one pass over the text.
+
+	Tags without a closed pair fall back to extract_xml_tag, so a missing
+	end tag is tolerated the same way.
+	"""
+	wanted = {name.lower() for name in names}
+	found = {}
+	if not raw_text:
+		return found
+	for match in _XML_PAIR_RE.finditer(raw_text):
+		tag = match.group(1).lower()
+		if tag in wanted:
+			found[tag] = match.group(2).strip()
+	for name in names:
+		if name.lower() not in found:
+			value = extract_xml_tag(raw_text, name)
+			if value:
+				found[name.lower()] = value
+	return found
 
 _raw = "<response>Hello</response>"
 assert extract_xml_tag(_raw, "response") == "Hello"
@@ -194,11 +240,51 @@ def select_ollama_model() -> str:
 		)
 	return model_name
 
+#============================================
+def ollama_api_available() -> bool:
+	"""
+	Probe the Ollama HTTP API and remember the answer.
+	A failed probe is retried after OLLAMA_REPROBE_SECONDS, so a daemon
+	started later is still found.
+	"""
+	global _ollama_api_up, _ollama_probed_at
+	if _ollama_api_up is False and time.time() - _ollama_probed_at >= OLLAMA_REPROBE_SECONDS:
+		_ollama_api_up = None
+	if _ollama_api_up is None:
+		_ollama_probed_at = time.time()
+		try:
+			_OLLAMA_SESSION.get(f"{OLLAMA_BASE_URL}/api/version", timeout=OLLAMA_PROBE_TIMEOUT_SECONDS).raise_for_status()
+			_ollama_api_up = True
+		except requests.RequestException:
+			_ollama_api_up = False
+	return _ollama_api_up
+
+#============================================
+def _ollama_generate(prompt: str, model_name: str) -> str:
+	"""
+	Run one non-streaming /api/generate request and return the response text.
+	"""
+	payload = {
+		"model": model_name,
+		"prompt": prompt,
+		"stream": False,
+		"keep_alive": OLLAMA_KEEP_ALIVE,
+	}
+	response = _OLLAMA_SESSION.post(
+		f"{OLLAMA_BASE_URL}/api/generate",
+		json=payload,
+		timeout=OLLAMA_REQUEST_TIMEOUT_SECONDS,
+	)
+	response.raise_for_status()
+	return response.json().get("response", "")
+
 #============================================
 def query_ollama_model(prompt: str, model_name: str) -> str:
 	"""
 	Query Ollama with the given prompt, handling model selection.
 
+	Uses the HTTP API when the daemon answers, otherwise the ollama CLI.
+
 	Args:
 		prompt (str): Prompt text.
 		model_name (str): Name of the Ollama model to use.
@@ -208,14 +294,24 @@ def query_ollama_model(prompt: str, model_name: str) -> str:
 	"""
 	print(f"{Colors.SKY_BLUE}Sending prompt to LLM with model {escape(model_name)}...{Colors.ENDC}")
 	print(f"{Colors.TEAL}Waiting for response...{Colors.ENDC}")
-	command = ["ollama", "run", model_name, prompt]
+	global _ollama_api_up
 	start_time = time.time()
-	result = subprocess.run(command, capture_output=True, text=True)
+	output = None
+	if ollama_api_available():
+		try:
+			output = _ollama_generate(prompt, model_name).strip()
+		except (requests.RequestException, ValueError) as error:
+			print(f"{Colors.WARNING}Ollama HTTP error: {escape(str(error))}; trying the ollama CLI.{Colors.ENDC}")
+			# probe again next call, so a restarted daemon is picked back up
+			_ollama_api_up = None
+	if output is None:
+		command = ["ollama", "run", model_name, prompt]
+		result = subprocess.run(command, capture_output=True, text=True)
+		if result.returncode != 0:
+			print(f"{Colors.FAIL}Ollama error: {escape(result.stderr.strip())}{Colors.ENDC}")
+			return ""
+		output = result.stdout.strip()
 	elapsed = time.time() - start_time
-	if result.returncode != 0:
-		print(f"{Colors.FAIL}Ollama error: {escape(result.stderr.strip())}{Colors.ENDC}")
-		return ""
-	output = result.stdout.strip()
 	print(
 		f"{Colors.NAVY}LLM response length: {len(output)} characters "
 		f"({elapsed:.2f}s).{Colors.ENDC}"
@@ -268,6 +364,43 @@ def get_default_model_name(backend: str | None = None) -> str | None:
 		return None
 	return select_ollama_model()
 
+#============================================
+def warm_up_model(model_name: str | None = None, backend: str | None = None) -> None:
+	"""
+	Load the Ollama model ahead of the first real prompt.
+
+	An empty prompt makes Ollama load the weights and return without generating,
+	so the first intro does not pay the cold start. Safe to call repeatedly and
+	from a background thread; AFM needs no warm-up and is skipped.
+	"""
+	chosen = get_llm_backend(backend)
+	if chosen == "afm" or (chosen == "auto" and is_apple_model_available()):
+		return
+	try:
+		resolved_model = model_name or select_ollama_model()
+	except RuntimeError:
+		return
+	with _WARM_LOCK:
+		if resolved_model in _WARMED_MODELS:
+			return
+		_WARMED_MODELS.add(resolved_model)
+	global _ollama_api_up
+	if ollama_api_available():
+		try:
+			_ollama_generate("", resolved_model)
+			return
+		except (requests.RequestException, ValueError):
+			_ollama_api_up = None
+	try:
+		subprocess.run(
+			["ollama", "run", resolved_model],
+			stdin=subprocess.DEVNULL,
+			capture_output=True,
+			timeout=WARM_UP_TIMEOUT_SECONDS,
+		)
+	except (OSError, subprocess.TimeoutExpired):
+		return
+
 #============================================
 def run_llm(
 	prompt: str,
@@ -277,6 +410,9 @@ def run_llm(
 ) -> str:
 	"""
 	Run an LLM call using the configured backend.
+	Safe to call from several threads: Ollama calls share one pooled HTTP
+	session (or run as separate CLI processes) and each AFM call opens its
+	own session.
 
 	Args:
 		prompt (str): Prompt text.
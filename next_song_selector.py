@@ -127,7 +127,7 @@ def build_fallback_reason(choice_text: str, chosen_song: Song | None, candidates
 	)
 
 #============================================
-def build_selection_prompt(current_song: Song, candidates: list[Song]) -> str:
+def build_selection_prompt(current_song: Song, candidates: list[Song], prompt_name: str = "next_song_selection.txt") -> str:
 	"""
 	Build the LLM prompt for next-song selection.
 	"""
@@ -136,16 +136,11 @@ def build_selection_prompt(current_song: Song, candidates: list[Song]) -> str:
 	last_title = current_song.title.lower()
 
 	current_song_line = (
-		f"{os.path.basename(current_song.path)} | "
+		f"{current_song.basename} | "
 		f"Artist: {last_artist} | Album: {last_album} | Title: {last_title}"
 	)
-	candidate_lines = []
-	for song in candidates:
-		candidate_lines.append(
-			f"- {os.path.basename(song.path)} | "
-			f"Artist: {song.artist} | Album: {song.album} | Title: {song.title}"
-		)
-	template = prompt_loader.load_prompt("next_song_selection.txt")
+	candidate_lines = audio_utils.format_candidate_lines(candidates)
+	template = prompt_loader.load_prompt(prompt_name)
 	return prompt_loader.render_prompt(
 		template,
 		{
@@ -217,12 +212,12 @@ def match_candidate_choice(choice_text: str, candidates: list[Song]) -> Song | N
 	lower_choice = choice_text.lower()
 
 	for song in candidates:
-		base_name = os.path.basename(song.path).strip()
+		base_name = song.basename.strip()
 		if base_name == choice_text or base_name.lower() == lower_choice:
 			return song
 
 	for song in candidates:
-		candidate_keys = _candidate_key_variants(os.path.basename(song.path))
+		candidate_keys = _candidate_key_variants(song.basename)
 		if choice_keys.intersection(candidate_keys):
 			return song
 
@@ -235,17 +230,13 @@ def build_candidate_songs(current_song: Song, song_list: list[str], sample_size:
 	"""
 	if len(song_list) <= 1:
 		return []
-	candidate_paths = audio_utils.select_song_list(song_list, sample_size)
-	while current_song.path in candidate_paths and len(song_list) > 1:
-		candidate_paths = audio_utils.select_song_list(song_list, sample_size)
-
-	candidates = []
-	for path in candidate_paths:
-		song = Song(path)
-		if song.artist == current_song.artist:
-			continue
-		candidates.append(song)
-	return candidates
+	# draw one extra path so dropping the current song needs no resampling
+	candidate_paths = audio_utils.select_song_list(song_list, sample_size + 1)
+	candidate_paths = [path for path in candidate_paths if path != current_song.path][:sample_size]
+
+	# tag reads are disk-bound, so load the whole pool on threads
+	songs = audio_utils.build_songs(candidate_paths)
+	return [song for song in songs if song.artist != current_song.artist]
 
 #============================================
 def choose_next_song(current_song: Song, song_list: list[str], sample_size: int, model_name: str | None = None, candidates: list[Song] | None = None, show_candidates: bool = True) -> SelectionResult:
@@ -269,9 +260,7 @@ def choose_next_song(current_song: Song, song_list: list[str], sample_size: int,
 
 	if show_candidates:
 		print(f"{Colors.OKMAGENTA}Candidates for next song:{Colors.ENDC}")
-		lines = [song.one_line_info(color=True) for song in candidate_songs]
-		lines.sort()
-		print('\n'.join(lines))
+		print(audio_utils.format_song_lines(candidate_songs, color=True))
 
 	prompt = build_selection_prompt(current_song, candidate_songs)
 
@@ -317,13 +306,74 @@ def choose_next_song(current_song: Song, song_list: list[str], sample_size: int,
 	if not is_reason_acceptable(reason, candidate_songs):
 		reason = build_fallback_reason(choice, chosen_song, candidate_songs)
 	if chosen_song:
-		base_name = escape(os.path.basename(chosen_song.path).strip())
+		base_name = escape(chosen_song.basename.strip())
 		print(f"{Colors.OKCYAN}Final next song: {base_name}{Colors.ENDC}")
 	if chosen_song is None:
 		print(f"{Colors.WARNING}LLM choice did not match any candidate; no selection made.{Colors.ENDC}")
 
 	return SelectionResult(chosen_song, choice, reason or "", raw_choice or "")
 
+#============================================
+def _pair_result(raw: str, pick_tag: str, reason_tag: str, candidates: list[Song]) -> SelectionResult:
+	"""
+	Turn one pick/reason tag pair from a two-pick reply into a SelectionResult.
+	"""
+	raw_choice = llm_wrapper.extract_xml_tag(raw, pick_tag)
+	choice = clean_llm_choice(raw_choice)
+	reason = llm_wrapper.extract_xml_tag(raw, reason_tag)
+	chosen_song = match_candidate_choice(choice, candidates)
+	if not is_reason_acceptable(reason, candidates):
+		reason = build_fallback_reason(choice, chosen_song, candidates)
+	return SelectionResult(chosen_song, choice, reason or "", raw_choice or "")
+
+#============================================
+def choose_two_next_songs(
+	current_song: Song,
+	song_list: list[str],
+	sample_size: int,
+	model_name: str | None = None,
+	candidates: list[Song] | None = None,
+) -> tuple[SelectionResult | None, SelectionResult | None]:
+	"""
+	Ask the LLM for two distinct next-song picks in a single request.
+
+	One prompt prefill serves both picks, replacing two separate selector calls.
+
+	Returns:
+		tuple[SelectionResult | None, SelectionResult | None]: Results for pick A and pick B,
+		or (None, None) when the LLM returned no reply at all.
+	"""
+	empty = SelectionResult(None, "", "", "")
+	if len(song_list) <= 1:
+		return empty, empty
+	candidate_songs = candidates if candidates is not None else build_candidate_songs(current_song, song_list, sample_size)
+	if not candidate_songs:
+		return empty, empty
+
+	prompt = build_selection_prompt(current_song, candidate_songs, prompt_name="next_song_pair.txt")
+	raw = llm_wrapper.run_llm(prompt, model_name=model_name)
+	# run_llm returns "" when every backend failed, which is not a bad pick
+	if not raw.strip():
+		return None, None
+	first = _pair_result(raw, "pick_a", "reason_a", candidate_songs)
+	second = _pair_result(raw, "pick_b", "reason_b", candidate_songs)
+	if not first.song and not second.song:
+		print(f"{Colors.WARNING}Neither pick matched a candidate; asking once more.{Colors.ENDC}")
+		raw = llm_wrapper.run_llm(prompt, model_name=model_name)
+		if not raw.strip():
+			return None, None
+		first = _pair_result(raw, "pick_a", "reason_a", candidate_songs)
+		second = _pair_result(raw, "pick_b", "reason_b", candidate_songs)
+
+	for label, result in (("A", first), ("B", second)):
+		if result.song:
+			base_name = escape(result.song.basename.strip())
+			print(f"{Colors.OKGREEN}LLM pick {label}: {base_name}{Colors.ENDC}")
+			print(f"{Colors.OKMAGENTA}LLM reason {label}: {escape(result.reason)}{Colors.ENDC}")
+		elif result.raw_choice:
+			print(f"{Colors.WARNING}LLM pick {label} did not match any candidate: {escape(result.raw_choice)}{Colors.ENDC}")
+	return first, second
+
 #============================================
 def main() -> None:
 	args = parse_args()
@@ -1,5 +1,4 @@
 # Standard Library
-import os
 import time
 import warnings
 
@@ -20,7 +19,7 @@ def ensure_mixer_initialized() -> None:
 #============================================
 def play_song(song: audio_utils.Song) -> None:
 	ensure_mixer_initialized()
-	file_name = escape(os.path.basename(song.path))
+	file_name = escape(song.basename)
 	print(f"{audio_utils.Colors.OKGREEN}Playing song: {file_name}{audio_utils.Colors.ENDC}")
 	pygame.mixer.music.load(song.path)
 	pygame.mixer.music.play()
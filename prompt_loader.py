@@ -1,9 +1,12 @@
 # Standard Library
 import os
+import re
 import subprocess
 
 
 _PROMPT_CACHE = {}
+_TEMPLATE_PARTS = {}
+_TOKEN_RE = re.compile(r"\{\{(\w+)\}\}")
 _REPO_ROOT = ""
 
 
@@ -58,16 +61,31 @@ def load_prompt(prompt_name: str) -> str:
 	return text
 
 
+#============================================
+def _template_parts(template: str) -> list[str]:
+	"""
+	Split a template into alternating literal text and token names, once per template.
+	"""
+	parts = _TEMPLATE_PARTS.get(template)
+	if parts is None:
+		parts = _TOKEN_RE.split(template)
+		_TEMPLATE_PARTS[template] = parts
+	return parts
+
+
 #============================================
 def render_prompt(template: str, values: dict[str, str]) -> str:
 	"""
-	Replace {{token}} placeholders with supplied values.
+	Replace {{token}} placeholders with supplied values in a single pass.
 	"""
 	if not template:
 		return ""
-	rendered = template
-	for key, value in values.items():
-		token = "{{" + key + "}}"
-		replacement = value if value is not None else ""
-		rendered = rendered.replace(token, replacement)
-	return rendered
+	pieces = list(_template_parts(template))
+	# odd indexes hold token names; unknown tokens are left in place
+	for index in range(1, len(pieces), 2):
+		key = pieces[index]
+		if key in values:
+			pieces[index] = values[key] or ""
+		else:
+			pieces[index] = "{{" + key + "}}"
+	return "".join(pieces)
@@ -2,7 +2,6 @@
 
 # Standard Library
 import argparse
-import os
 import re
 import unicodedata
 
@@ -13,7 +12,6 @@ from rich.markup import escape
 # Local repo modules
 from cli_colors import Colors
 import audio_utils
-import audio_file_to_details
 import llm_wrapper
 import transcribe_audio
 import prompt_loader
@@ -30,6 +28,9 @@ MIN_RELAXED_WORDS = 12
 MAX_REPEAT_SENTENCE = 2
 EXPECTED_FACT_LINES = 5
 MAX_LYRICS_CHARS = 1200
+# finished fetch_song_details text, refreshed monthly so facts do not go stale
+DETAILS_CACHE_ENDPOINT = "song_details"
+DETAILS_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
 TITLE_STOPWORDS = {
 	"a",
 	"an",
@@ -62,6 +63,13 @@ TITLE_STOPWORDS = {
 	"with",
 }
 MAX_REFINE_ATTEMPTS = 1
+# stock radio openers the model falls back on; matched at the start of an intro
+_BOILERPLATE_RE = re.compile(
+	r"\s*(?:ladies and gentlemen,?\s*welcome to"
+	r"|(?:hey there|hello|hi there),?\s*(?:disney fans|music lovers|folks|everyone)\b)",
+	re.IGNORECASE,
+)
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]\s+")
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -180,16 +188,7 @@ def _to_aggressive_ascii(text: str) -> str:
 def _starts_with_boilerplate(text: str) -> bool:
 	if not text:
 		return False
-	patterns = [
-		r"^\s*ladies and gentlemen,?\s*welcome to",
-		r"^\s*hey there,?\s*(?:disney fans|music lovers|folks|everyone)\b",
-		r"^\s*hello,?\s*(?:disney fans|music lovers|folks|everyone)\b",
-		r"^\s*hi there,?\s*(?:disney fans|music lovers|folks|everyone)\b",
-	]
-	for pattern in patterns:
-		if re.match(pattern, text, flags=re.IGNORECASE):
-			return True
-	return False
+	return _BOILERPLATE_RE.match(text) is not None
 
 #============================================
 def _strip_leading_boilerplate_sentence(text: str) -> str:
@@ -197,7 +196,7 @@ def _strip_leading_boilerplate_sentence(text: str) -> str:
 		return ""
 	if not _starts_with_boilerplate(text):
 		return text
-	match = re.search(r"[.!?]\s+", text)
+	match = _SENTENCE_BREAK_RE.search(text)
 	if match:
 		return text[match.end():].lstrip()
 	return ""
@@ -507,11 +506,11 @@ def prepare_intro_text(
 	Returns:
 		str | None: Cleaned intro text inside <response> tags, or None on failure.
 	"""
-	file_name = escape(os.path.basename(song.path))
+	file_name = escape(song.basename)
 	print(f"{Colors.OKBLUE}Gathering song info and building prompt for {file_name}...{Colors.ENDC}")
 
 	if lyrics_text is None and song:
-		file_name = escape(os.path.basename(song.path))
+		file_name = escape(song.basename)
 		print(f"{Colors.OKBLUE}Transcribing lyrics for {file_name}...{Colors.ENDC}")
 		lyrics_text = transcribe_audio.transcribe_audio(song.path)
 
@@ -660,9 +659,24 @@ def build_prompt(
 
 #============================================
 def fetch_song_details(song: audio_utils.Song) -> str:
+	# Deferred so text-only callers skip loading requests, lxml, and the cache
+	import disk_cache
+	import audio_file_to_details
+	# keyed on tags so re-rips and replays share one entry; untagged files use the path
+	if audio_utils.has_real_tags(song):
+		query = f"{song.artist}|{song.title}|{song.album}"
+	else:
+		query = song.path
+	cached = disk_cache.get_response(DETAILS_CACHE_ENDPOINT, query, DETAILS_CACHE_MAX_AGE_SECONDS)
+	if cached is not None:
+		return cached.decode("utf-8")
 	meta = audio_file_to_details.Metadata(song.path)
 	meta.fetch_wikipedia_info()
-	return meta.get_results()
+	details_text = meta.get_results()
+	# an outage yields only placeholders; do not pin those for a month
+	if meta.has_summary():
+		disk_cache.store_response(DETAILS_CACHE_ENDPOINT, query, details_text.encode("utf-8"))
+	return details_text
 
 #============================================
 def main() -> None:
@@ -680,7 +694,7 @@ def main() -> None:
 			details_text = song_obj.one_line_info()
 		lyrics_text = None
 		if song_obj:
-			file_name = escape(os.path.basename(song_obj.path))
+			file_name = escape(song_obj.basename)
 			print(f"{Colors.OKBLUE}Transcribing lyrics for {file_name}...{Colors.ENDC}")
 			lyrics_text = transcribe_audio.transcribe_audio(song_obj.path)
 		prompt = build_prompt(
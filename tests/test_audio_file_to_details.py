@@ -0,0 +1,255 @@
+import collections
+
+import audio_file_to_details
+
+
+#============================================
+def test_first_meta_content_handles_attribute_order_and_entities() -> None:
+	html_body = (
+		b'<html><head><meta content="Rock &amp; roll\nanthem" property="og:description">'
+		b'</head><body></body></html>'
+	)
+	desc = audio_file_to_details._first_meta_content(
+		html_body, (audio_file_to_details._OG_DESC_XPATH,)
+	)
+	assert desc == "Rock & roll anthem"
+
+
+#============================================
+def test_first_meta_content_prefers_first_xpath() -> None:
+	html_body = (
+		b'<html><head><meta property="og:description" content="OpenGraph text">'
+		b'<meta name="description" content="Meta text"></head></html>'
+	)
+	xpaths = (audio_file_to_details._META_DESC_XPATH, audio_file_to_details._OG_DESC_XPATH)
+	assert audio_file_to_details._first_meta_content(html_body, xpaths) == "Meta text"
+
+
+#============================================
+def test_first_meta_content_returns_none_for_empty_page() -> None:
+	xpaths = (audio_file_to_details._OG_DESC_XPATH,)
+	assert audio_file_to_details._first_meta_content(b"  ", xpaths) is None
+
+
+#============================================
+def test_fetch_fallback_description_uses_any_service_with_text(monkeypatch) -> None:
+	monkeypatch.setattr(audio_file_to_details.Metadata, "_fetch_lastfm_wiki", lambda self, kind: (None, None))
+	monkeypatch.setattr(
+		audio_file_to_details.Metadata, "_fetch_allmusic_description",
+		lambda self, query, kind: ("https://am/x", "AllMusic text"),
+	)
+	meta = audio_file_to_details.Metadata.__new__(audio_file_to_details.Metadata)
+	result = meta._fetch_fallback_description("Queen", kind="artist")
+	assert result == ("https://am/x", "AllMusic text")
+
+
+#============================================
+def test_wait_for_wikipedia_slot_allows_burst_then_paces(monkeypatch) -> None:
+	sleeps = []
+	monkeypatch.setattr(audio_file_to_details.time, "sleep", sleeps.append)
+	monkeypatch.setattr(audio_file_to_details.time, "monotonic", lambda: 100.0)
+	monkeypatch.setattr(audio_file_to_details, "_wiki_tokens", 0.0)
+	monkeypatch.setattr(audio_file_to_details, "_wiki_tokens_updated", 0.0)
+	for _ in range(audio_file_to_details.WIKIPEDIA_BURST):
+		audio_file_to_details._wait_for_wikipedia_slot()
+	assert sleeps == []
+	audio_file_to_details._wait_for_wikipedia_slot()
+	audio_file_to_details._wait_for_wikipedia_slot()
+	interval = 1 / audio_file_to_details.WIKIPEDIA_REQUESTS_PER_SECOND
+	assert sleeps == [interval, 2 * interval]
+
+
+#============================================
+def test_page_summary_skips_disambiguation_and_empty_pages() -> None:
+	disambiguation = {"title": "Queen", "extract": "Queen may refer to:", "pageprops": {"disambiguation": ""}}
+	assert audio_file_to_details._page_summary(disambiguation) is None
+	assert audio_file_to_details._page_summary({"title": "Queen", "missing": ""}) is None
+	page = {"title": "Queen (band)", "extract": "Queen are a British rock band."}
+	title, url, extract = audio_file_to_details._page_summary(page)
+	assert title == "Queen (band)"
+	assert url == "https://en.wikipedia.org/wiki/Queen_%28band%29"
+	assert extract == "Queen are a British rock band."
+
+
+#============================================
+def test_search_wikipedia_memoizes_successful_queries(monkeypatch) -> None:
+	monkeypatch.setattr(audio_file_to_details, "_LOOKUP_CACHE", collections.OrderedDict())
+	meta = audio_file_to_details.Metadata.__new__(audio_file_to_details.Metadata)
+	meta.debug = False
+	calls = []
+
+	def fake_search_pages(self, query: str) -> list:
+		calls.append(query)
+		return [("Queen (band)", "https://en.wikipedia.org/wiki/Queen_(band)", "Rock band.")]
+
+	monkeypatch.setattr(audio_file_to_details.Metadata, "_fetch_wikipedia_search_pages", fake_search_pages)
+	first = meta.search_wikipedia("the artist Queen")
+	second = meta.search_wikipedia("  The Artist   queen ")
+	assert first == second
+	assert calls == ["the artist queen"]
+
+
+#============================================
+class _FakeStreamResponse:
+	def __init__(self, chunks: list) -> None:
+		self.chunks = chunks
+		self.consumed = 0
+
+	def iter_content(self, chunk_size: int):
+		for chunk in self.chunks:
+			self.consumed += 1
+			yield chunk
+
+
+#============================================
+def test_read_until_marker_stops_after_split_head_close() -> None:
+	resp = _FakeStreamResponse([b"<html><head><meta></HE", b"AD><body>", b"big body"])
+	body = audio_file_to_details._read_until_marker(resp, b"</head>")
+	assert body == b"<html><head><meta></HEAD><body>"
+	assert resp.consumed == 2
+
+
+#============================================
+def test_fetch_wikipedia_info_skips_placeholder_tags(monkeypatch) -> None:
+	meta = audio_file_to_details.Metadata.__new__(audio_file_to_details.Metadata)
+	meta.title = "!!!"
+	meta.artist = "Queen"
+	meta.album = audio_file_to_details.UNKNOWN_ALBUM
+	meta.is_compilation = False
+	meta._build_query_slugs()
+	called = []
+	for kind in ("song", "artist", "album"):
+		monkeypatch.setattr(
+			audio_file_to_details.Metadata, f"_lookup_{kind}",
+			lambda self, kind=kind: called.append(kind),
+		)
+	meta.fetch_wikipedia_info()
+	assert called == ["artist"]
+	called.clear()
+	meta.title = "If"
+	meta._build_query_slugs()
+	meta.fetch_wikipedia_info()
+	assert sorted(called) == ["artist", "song"]
+	called.clear()
+	meta.artist = audio_file_to_details.UNKNOWN_ARTIST
+	meta.fetch_wikipedia_info()
+	assert called == []
+
+
+#============================================
+def test_http_session_requests_compressed_responses() -> None:
+	headers = audio_file_to_details.HTTP_SESSION.headers
+	assert "gzip" in headers["Accept-Encoding"]
+	assert headers["Connection"] == "keep-alive"
+
+
+#============================================
+def test_clean_summary_bullets_each_paragraph() -> None:
+	summary = audio_file_to_details._clean_summary("  First paragraph.\nSecond one.\n")
+	assert summary == "* First paragraph.\n* Second one."
+
+
+#============================================
+def test_get_results_formats_present_sections() -> None:
+	meta = audio_file_to_details.Metadata.__new__(audio_file_to_details.Metadata)
+	meta.title = "Song"
+	meta.artist = "Band"
+	meta.album = "Record"
+	meta.artist_summary = "* Band text."
+	meta.artist_url = "https://a"
+	meta.album_summary = None
+	meta.album_url = None
+	meta.song_summary = "* Song text."
+	meta.song_url = "https://s"
+	expected = (
+		"\nArtist: Band\nhttps://a\nSummary:\n* Band text...."
+		"\n\nSong: Song\nhttps://s\nSummary:\n* Song text...."
+	)
+	assert meta.get_results() == expected
+	meta.artist_summary = None
+	meta.song_summary = None
+	assert meta.get_results() == "No relevant Wikipedia pages found."
+
+
+#============================================
+def test_search_wikipedia_memoizes_misses_but_not_failures(monkeypatch) -> None:
+	monkeypatch.setattr(audio_file_to_details, "_LOOKUP_CACHE", collections.OrderedDict())
+	meta = audio_file_to_details.Metadata.__new__(audio_file_to_details.Metadata)
+	meta.debug = False
+	calls = []
+
+	def fake_search_pages(self, query: str) -> list | None:
+		calls.append(query)
+		if query == "offline":
+			return None
+		return []
+
+	monkeypatch.setattr(audio_file_to_details.Metadata, "_fetch_wikipedia_search_pages", fake_search_pages)
+	for _ in range(2):
+		assert meta.search_wikipedia("obscure band") == (None, None, None)
+		assert meta.search_wikipedia("offline") == (None, None, None)
+	assert calls == ["obscure band", "offline", "offline"]
+
+
+#============================================
+def test_clean_title_keeps_ascii_alnum_and_whitespace() -> None:
+	title = "Caf\u00e9 Del Mar (feat. Someone) - Remix! 2\t"
+	assert audio_file_to_details._clean_title(title) == "Caf Del Mar   Remix 2"
+
+
+#============================================
+class _FakeSessionResponse:
+	status_code = 200
+	content = b"{}"
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		return None
+
+
+#============================================
+def test_cached_get_sends_per_request_headers(monkeypatch) -> None:
+	sent = []
+	monkeypatch.setattr(audio_file_to_details.disk_cache, "get_response", lambda endpoint, query: None)
+	monkeypatch.setattr(audio_file_to_details.disk_cache, "store_response", lambda endpoint, query, body: None)
+
+	def fake_get(url, **kwargs):
+		sent.append(kwargs["headers"])
+		return _FakeSessionResponse()
+
+	monkeypatch.setattr(audio_file_to_details.HTTP_SESSION, "get", fake_get)
+	headers = audio_file_to_details.WIKIPEDIA_HEADERS
+	body = audio_file_to_details._cached_get("wikipedia_search", "https://example.org/api", headers=headers)
+	assert body == b"{}"
+	assert sent == [headers]
+
+
+#============================================
+def test_lookup_memo_evicts_least_recently_used(monkeypatch) -> None:
+	monkeypatch.setattr(audio_file_to_details, "_LOOKUP_CACHE", collections.OrderedDict())
+	monkeypatch.setattr(audio_file_to_details, "MAX_LOOKUP_CACHE_ENTRIES", 2)
+	audio_file_to_details._memo_put(("a",), 1)
+	audio_file_to_details._memo_put(("b",), 2)
+	assert audio_file_to_details._memo_get(("a",)) == 1
+	audio_file_to_details._memo_put(("c",), 3)
+	assert audio_file_to_details._memo_get(("b",)) is audio_file_to_details._MISSING
+	assert list(audio_file_to_details._LOOKUP_CACHE) == [("a",), ("c",)]
+
+
+#============================================
+def test_main_batch_continues_after_lookup_errors(monkeypatch, capsys) -> None:
+	def fake_process(filename: str, debug: bool) -> str:
+		if filename == "network.mp3":
+			raise audio_file_to_details.requests.ConnectionError("offline")
+		if filename == "cache.mp3":
+			raise audio_file_to_details.sqlite3.OperationalError("database is locked")
+		return f"details for {filename}"
+
+	monkeypatch.setattr(audio_file_to_details, "process_one", fake_process)
+	audio_file_to_details.main_batch(["network.mp3", "cache.mp3", "good.mp3"])
+	output = capsys.readouterr().out
+	assert "details for good.mp3" in output
+	assert "Error for network.mp3" in output
+	assert "Error for cache.mp3" in output
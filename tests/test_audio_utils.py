@@ -1,3 +1,12 @@
+# Standard Library
+import os
+import sqlite3
+from types import SimpleNamespace
+
+# PIP3 modules
+import mutagen.id3
+
+# Local repo modules
 import audio_utils
 
 
@@ -22,3 +31,124 @@ def test_extract_year_from_candidates_prefers_first_valid() -> None:
 	result = audio_utils._extract_year_from_candidates(None, "nope", "2005", "2012")
 	assert result == "2005"
 
+
+
+#============================================
+def test_build_songs_keeps_order_and_passes_songs_through(tmp_path) -> None:
+	paths = [str(tmp_path / f"track_{index}.wav") for index in range(5)]
+	existing = audio_utils.Song(paths[2])
+	songs = audio_utils.build_songs(paths[:2] + [existing] + paths[3:])
+	assert [song.path for song in songs] == paths
+	assert songs[2] is existing
+	assert songs[0].title == "track_0"
+
+
+#============================================
+def test_song_reads_unchanged_file_tags_from_cache(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(audio_utils.disk_cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+	monkeypatch.setattr(audio_utils.disk_cache, "_CONNECTION", None)
+	song_path = tmp_path / "cached.mp3"
+	song_path.write_bytes(b"not really audio")
+	stat_result = os.stat(song_path)
+	info = {
+		"title": "Cached Title", "artist": "Cached Artist", "album": "Cached Album",
+		"year": "1984", "length_seconds": 185, "is_compilation": True,
+	}
+	audio_utils.disk_cache.store_song_info(
+		str(song_path), stat_result.st_mtime_ns, stat_result.st_size, info
+	)
+	song = audio_utils.Song(str(song_path))
+	assert song.artist == "Cached Artist"
+	assert song.length_seconds == 185
+	assert song.is_compilation is True
+
+
+#============================================
+def test_song_memoizes_tags_in_process(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(audio_utils, "_SONG_INFO_MEMO", {})
+	lookups = []
+	info = {
+		"title": "Memo Title", "artist": "Memo Artist", "album": "Memo Album",
+		"year": None, "length_seconds": 60, "is_compilation": False,
+	}
+
+	def fake_get(path, mtime_ns, size):
+		lookups.append(path)
+		return info
+
+	monkeypatch.setattr(audio_utils.disk_cache, "get_song_info", fake_get)
+	song_path = tmp_path / "memo.mp3"
+	song_path.write_bytes(b"not really audio")
+	first = audio_utils.Song(str(song_path))
+	second = audio_utils.Song(str(song_path))
+	assert first.artist == second.artist == "Memo Artist"
+	assert lookups == [str(song_path)]
+
+#============================================
+def test_tag_only_easyid3_skips_cover_art(tmp_path) -> None:
+	path = str(tmp_path / "tagged.mp3")
+	tags = mutagen.id3.ID3()
+	tags.add(mutagen.id3.TIT2(encoding=3, text=["Title"]))
+	tags.add(mutagen.id3.APIC(encoding=3, mime="image/jpeg", type=3, desc="", data=b"\xff" * 64))
+	tags.save(path)
+	easy = audio_utils.TagOnlyEasyID3(path)
+	assert easy["title"] == ["Title"]
+	assert easy._EasyID3__id3.getall("APIC") == []
+
+
+#============================================
+def test_get_song_list_walks_nested_directories(tmp_path) -> None:
+	nested = tmp_path / "album" / "disc1"
+	nested.mkdir(parents=True)
+	for path in (tmp_path / "a.MP3", nested / "b.flac", nested / "notes.txt", tmp_path / "mp3"):
+		path.write_bytes(b"")
+	expected = sorted([str(tmp_path / "a.MP3"), str(nested / "b.flac")])
+	assert audio_utils.get_song_list(str(tmp_path)) == expected
+
+
+#============================================
+def test_format_song_lines_sorts_and_formats(tmp_path) -> None:
+	songs = [audio_utils.Song(str(tmp_path / name)) for name in ("b.mp3", "a.mp3")]
+	songs[0].artist = "Band"
+	assert audio_utils.format_song_lines(songs) == "b.mp3 | Artist: Band\na.mp3 | Artist: Unknown Artist"
+	lines = audio_utils.format_candidate_lines(songs)
+	assert lines[0] == "- b.mp3 | Artist: Band | Album: Unknown Album | Title: b"
+
+#============================================
+def test_one_line_info_follows_tag_changes(tmp_path) -> None:
+	song = audio_utils.Song(str(tmp_path / "track.mp3"))
+	song.artist = "First"
+	song.length_seconds = 125
+	song.year = "1999"
+	assert song.one_line_info() == "02:05 | track.mp3 | Artist: First | (1999)"
+	song.artist = "Second"
+	assert "Artist: Second" in song.one_line_info()
+
+
+#============================================
+def test_has_real_tags_ignores_filename_fallback() -> None:
+	untagged = SimpleNamespace(basename="track.mp3", artist="Unknown Artist", title="track")
+	assert audio_utils.has_real_tags(untagged) is False
+	assert audio_utils.has_real_tags(SimpleNamespace(basename="track.mp3", artist="Queen", title="track")) is True
+
+
+#============================================
+def test_song_reads_tags_when_cache_is_broken(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(audio_utils, "_SONG_INFO_MEMO", {})
+
+	def locked_get(path, mtime_ns, size):
+		raise sqlite3.OperationalError("database is locked")
+
+	def readonly_store(path, mtime_ns, size, info):
+		raise OSError("read-only file system")
+
+	def fake_loader(song) -> None:
+		song.artist = "Tag Artist"
+
+	monkeypatch.setattr(audio_utils.disk_cache, "get_song_info", locked_get)
+	monkeypatch.setattr(audio_utils.disk_cache, "store_song_info", readonly_store)
+	monkeypatch.setitem(audio_utils._TAG_LOADERS, ".mp3", fake_loader)
+	song_path = tmp_path / "broken_cache.mp3"
+	song_path.write_bytes(b"not really audio")
+	song = audio_utils.Song(str(song_path))
+	assert song.artist == "Tag Artist"
@@ -0,0 +1,152 @@
+# Standard Library
+import wave
+import array
+import collections
+
+# PIP3 modules
+import pytest
+
+numpy = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("soundfile")
+
+# Local repo modules
+import audio_wav
+
+
+#============================================
+def _pcm16(values: list) -> bytes:
+	return array.array("h", values).tobytes()
+
+
+#============================================
+def _check_conversions() -> None:
+	raw = _pcm16([100, 300, -5, -2, 32767, 32767])
+	mono, channels = audio_wav._convert_channels(raw, 2, True, 2, 1)
+	assert channels == 1
+	assert mono == _pcm16([200, -4, 32767])
+	stereo, channels = audio_wav._convert_channels(_pcm16([1, -2]), 2, True, 1, 2)
+	assert channels == 2
+	assert stereo == _pcm16([1, 1, -2, -2])
+
+
+#============================================
+def test_convert_channels_downmix_and_upmix() -> None:
+	_check_conversions()
+
+
+#============================================
+def test_convert_channels_keeps_matching_layout() -> None:
+	raw = _pcm16([1, 2])
+	assert audio_wav._convert_channels(raw, 2, True, 2, 2) == (raw, 2)
+
+
+#============================================
+def test_write_wav_accepts_memoryview(tmp_path) -> None:
+	path = str(tmp_path / "out.wav")
+	raw = _pcm16([1, 2, 3, 4])
+	audio_wav._write_wav(path, memoryview(raw), 2, 2, 16000)
+	with wave.open(path, "rb") as wav_file:
+		assert wav_file.getnframes() == 2
+		assert wav_file.readframes(2) == raw
+	with open(path, "rb") as handle:
+		assert len(handle.read()) == 44 + len(raw)
+
+
+#============================================
+def _fresh_wav_cache(monkeypatch) -> None:
+	monkeypatch.setattr(audio_wav, "_WAV_CACHE", collections.OrderedDict())
+	monkeypatch.setattr(audio_wav, "_WAV_HOLDERS", collections.Counter())
+	monkeypatch.setattr(audio_wav, "_RETIRED_WAVS", set())
+
+
+#============================================
+def test_remember_wav_evicts_least_recently_used(monkeypatch, tmp_path) -> None:
+	_fresh_wav_cache(monkeypatch)
+	monkeypatch.setattr(audio_wav, "MAX_CACHED_WAVS", 2)
+	paths = []
+	for index in range(3):
+		path = tmp_path / f"{index}.wav"
+		path.write_bytes(b"")
+		paths.append(path)
+		audio_wav.release_wav(audio_wav._remember_wav((str(index),), str(path)))
+		if index == 1:
+			# a hit on "0" makes "1" the eviction candidate
+			audio_wav.release_wav(audio_wav._cached_wav(("0",)))
+	assert not paths[1].exists()
+	assert paths[0].exists() and paths[2].exists()
+	assert list(audio_wav._WAV_CACHE) == [("0",), ("2",)]
+
+
+#============================================
+def test_evicted_wav_survives_until_released(monkeypatch, tmp_path) -> None:
+	_fresh_wav_cache(monkeypatch)
+	monkeypatch.setattr(audio_wav, "MAX_CACHED_WAVS", 1)
+	held = tmp_path / "held.wav"
+	held.write_bytes(b"")
+	newer = tmp_path / "newer.wav"
+	newer.write_bytes(b"")
+	held_path = audio_wav._remember_wav(("held",), str(held))
+	audio_wav._remember_wav(("newer",), str(newer))
+	assert held.exists()
+	audio_wav.release_wav(held_path)
+	assert not held.exists()
+
+
+#============================================
+def test_remember_wav_keeps_first_copy_of_a_race(monkeypatch, tmp_path) -> None:
+	_fresh_wav_cache(monkeypatch)
+	winner = tmp_path / "winner.wav"
+	winner.write_bytes(b"")
+	loser = tmp_path / "loser.wav"
+	loser.write_bytes(b"")
+	assert audio_wav._remember_wav(("song",), str(winner)) == str(winner)
+	assert audio_wav._remember_wav(("song",), str(loser)) == str(winner)
+	assert not loser.exists()
+	assert audio_wav._WAV_HOLDERS[str(winner)] == 2
+
+
+#============================================
+def test_convert_channels_passes_empty_buffer_through() -> None:
+	assert audio_wav._convert_channels(b"", 2, True, 2, 1) == (b"", 2)
+
+
+#============================================
+def test_resample_halves_frame_count() -> None:
+	raw = numpy.arange(0, 800, 100, dtype="int16").repeat(2).tobytes()
+	resampled = audio_wav._resample(raw, "int16", 2, 32000, 16000)
+	samples = numpy.frombuffer(resampled, dtype="int16").reshape(-1, 2)
+	assert samples.shape == (4, 2)
+	assert samples[:, 0].tolist() == samples[:, 1].tolist()
+
+
+#============================================
+def test_create_transcription_wav_reuses_cached_file(monkeypatch, tmp_path) -> None:
+	source = tmp_path / "song.wav"
+	source.write_bytes(b"x")
+	calls = []
+
+	def fake_decode(path: str) -> tuple:
+		calls.append(path)
+		return _pcm16([1000, -1000] * 8), 2, 2, True, 16000
+
+	monkeypatch.setattr(audio_wav, "_decode_source", fake_decode)
+	monkeypatch.setattr(audio_wav, "_stream_temp_wav", lambda path, rate, channels: None)
+	monkeypatch.setattr(audio_wav, "TEMP_WAV_DIR", str(tmp_path))
+	_fresh_wav_cache(monkeypatch)
+	trans_path = audio_wav.create_transcription_wav(str(source))
+	with wave.open(trans_path, "rb") as handle:
+		assert handle.getnchannels() == 1
+		assert handle.getframerate() == 16000
+		assert handle.getnframes() == 8
+	assert audio_wav.create_transcription_wav(str(source)) == trans_path
+	assert calls == [str(source)]
+
+
+#============================================
+def test_convert_pcm_recenters_unsigned_16_bit() -> None:
+	# unsigned silence sits at 32768; full scale spans 0..65535
+	unsigned = array.array("H", [32768, 32768, 0, 0, 65535, 65535]).tobytes()
+	raw, channels, sample_width, signed, rate = audio_wav._convert_pcm((unsigned, 2, 2, False, 16000), 16000, 1)
+	assert (channels, sample_width, signed, rate) == (1, 2, True, 16000)
+	assert bytes(raw) == _pcm16([0, -32768, 32767])
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+
+# disc_jockey reaches audio_wav through transcribe_audio, which requires numpy
+pytest.importorskip("numpy")
+
+import disk_cache
+import disc_jockey
+
+
+#============================================
+def test_generate_intro_reuses_cached_referee_intro(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(disk_cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+	monkeypatch.setattr(disk_cache, "_CONNECTION", None)
+	calls = []
+
+	def fake_referee(song, prev_song) -> str:
+		calls.append(song.path)
+		return "Here comes a song."
+
+	dj = disc_jockey.DiscJockey.__new__(disc_jockey.DiscJockey)
+	dj.model_name = "tiny-model"
+	monkeypatch.setattr(dj, "_generate_intro_with_referee", fake_referee)
+	song = SimpleNamespace(path="/music/song.mp3", basename="song.mp3", artist="Queen", title="Song")
+	prev_song = SimpleNamespace(path="/music/abba.mp3", artist="ABBA")
+	assert dj._generate_intro(song, prev_song, use_referee=True) == "Here comes a song."
+	assert dj._generate_intro(song, prev_song, use_referee=True) == "Here comes a song."
+	assert calls == ["/music/song.mp3"]
+	other_prev = SimpleNamespace(path="/music/abba_live.mp3", artist="ABBA")
+	dj._generate_intro(song, other_prev, use_referee=True)
+	assert len(calls) == 2
+
+
+#============================================
+def test_take_lyrics_uses_prefetched_transcription(monkeypatch) -> None:
+	calls = []
+
+	def fake_transcribe(path: str) -> str:
+		calls.append(path)
+		return "la la la"
+
+	monkeypatch.setattr(disc_jockey.transcribe_audio, "transcribe_audio", fake_transcribe)
+	dj = disc_jockey.DiscJockey.__new__(disc_jockey.DiscJockey)
+	dj._transcribe_pool = disc_jockey.concurrent.futures.ThreadPoolExecutor(max_workers=1)
+	dj._transcribe_futures = {}
+	dj._transcribe_lock = disc_jockey.threading.Lock()
+	song = SimpleNamespace(path="/music/song.mp3")
+	dj._prefetch_lyrics(song)
+	dj._prefetch_lyrics(song)
+	assert dj._take_lyrics(song) == "la la la"
+	assert calls == ["/music/song.mp3"]
+	dj._transcribe_pool.shutdown()
+
+
+#============================================
+def test_clean_referee_reason_strips_boilerplate() -> None:
+	dj = disc_jockey.DiscJockey.__new__(disc_jockey.DiscJockey)
+	reason = "Option A is warmer,  Mentions the Band Name and is specific to the song details."
+	assert dj._clean_referee_reason(reason) == "Option A is warmer, and is"
+
+
+#============================================
+def test_fallback_next_song_never_repeats_last(monkeypatch) -> None:
+	monkeypatch.setattr(disc_jockey.audio_utils, "Song", lambda path: SimpleNamespace(path=path, basename=path))
+	dj = disc_jockey.DiscJockey.__new__(disc_jockey.DiscJockey)
+	last_song = SimpleNamespace(path="a.mp3")
+	dj.song_paths = ["a.mp3", "b.mp3"]
+	for _ in range(20):
+		assert dj._fallback_next_song(last_song, []).path == "b.mp3"
+	dj.song_paths = ["a.mp3"]
+	assert dj._fallback_next_song(last_song, []) is None
+	dj.song_paths = ["a.mp3"] * 100 + ["b.mp3"]
+	assert dj._fallback_next_song(last_song, []).path == "b.mp3"
+
+
+#============================================
+def test_referee_prompt_budget_helpers() -> None:
+	reason = "Smooth tempo match. Same era! Also a long third sentence."
+	assert disc_jockey._first_sentences(reason, 2) == "Smooth tempo match. Same era!"
+	details = "Artist: Queen\nAlbum: A Night at the Opera\nSummary: long text"
+	assert disc_jockey._trim_details(details, 30) == "Artist: Queen"
+	assert disc_jockey._trim_details(details, 500) == details
+
+
+#============================================
+def test_intro_verdicts_reports_strict_and_relaxed() -> None:
+	short = "Here is a fine song for you. It has a great groove. Enjoy the ride now."
+	assert disc_jockey._intro_verdicts(short) == ("too short (<200 chars)", "")
+	assert disc_jockey._intro_verdicts("FACT: nope") == ("contains FACT/TRIVIA lines",) * 2
+	long_intro = " ".join(["This track rolls in with a bright and busy horn line."] * 4)
+	assert disc_jockey._intro_verdicts(long_intro) == ("", "")
+
+
+#============================================
+def test_choose_next_backs_off_when_llm_returns_nothing(monkeypatch, tmp_path) -> None:
+	paths = [str(tmp_path / name) for name in ("alpha.mp3", "beta.mp3", "current.mp3")]
+	candidates = [disc_jockey.audio_utils.Song(paths[0]), disc_jockey.audio_utils.Song(paths[1])]
+	sleeps = []
+	llm_calls = []
+	monkeypatch.setattr(disc_jockey.next_song_selector, "build_candidate_songs", lambda song, paths, size: candidates)
+	monkeypatch.setattr(disc_jockey.next_song_selector.llm_wrapper, "run_llm", lambda prompt, model_name=None: llm_calls.append(prompt) or "")
+	monkeypatch.setattr(disc_jockey.time, "sleep", sleeps.append)
+	dj = disc_jockey.DiscJockey.__new__(disc_jockey.DiscJockey)
+	dj.args = SimpleNamespace(sample_size=2, verbose_candidates=False)
+	dj.song_paths = paths
+	dj.model_name = "tiny-model"
+	chosen = dj.choose_next(disc_jockey.audio_utils.Song(paths[2]))
+	assert chosen in candidates
+	assert len(llm_calls) == disc_jockey.MAX_NEXT_SONG_ATTEMPTS
+	assert len(sleeps) == disc_jockey.MAX_NEXT_SONG_ATTEMPTS
+	assert sleeps[-1] > sleeps[0]
@@ -0,0 +1,50 @@
+# Standard Library
+import os
+
+# Local repo modules
+import disk_cache
+
+
+#============================================
+def _use_temp_cache(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(disk_cache, "CACHE_PATH", os.path.join(str(tmp_path), "cache.sqlite3"))
+	monkeypatch.setattr(disk_cache, "_CONNECTION", None)
+
+
+#============================================
+def test_store_and_get_response_round_trip(monkeypatch, tmp_path) -> None:
+	_use_temp_cache(monkeypatch, tmp_path)
+	assert disk_cache.get_response("wikipedia_search", "Queen") is None
+	disk_cache.store_response("wikipedia_search", "Queen", b"{\"query\": {}}")
+	assert disk_cache.get_response("wikipedia_search", "Queen") == b"{\"query\": {}}"
+	assert disk_cache.get_response("lastfm", "Queen") is None
+
+
+#============================================
+def test_get_response_ignores_expired_rows(monkeypatch, tmp_path) -> None:
+	_use_temp_cache(monkeypatch, tmp_path)
+	disk_cache.store_response("lastfm", "Queen", b"<html></html>")
+	monkeypatch.setattr(disk_cache.time, "time", lambda: 10 ** 12)
+	assert disk_cache.get_response("lastfm", "Queen") is None
+
+
+#============================================
+def test_song_info_requires_matching_mtime_and_size(monkeypatch, tmp_path) -> None:
+	_use_temp_cache(monkeypatch, tmp_path)
+	info = {
+		"title": "Song", "artist": "Band", "album": "Record",
+		"year": "1999", "length_seconds": 200, "is_compilation": False,
+	}
+	disk_cache.store_song_info("/music/song.mp3", 111, 2048, info)
+	assert disk_cache.get_song_info("/music/song.mp3", 111, 2048) == info
+	assert disk_cache.get_song_info("/music/song.mp3", 222, 2048) is None
+	assert disk_cache.get_song_info("/music/song.mp3", 111, 4096) is None
+
+
+#============================================
+def test_default_cache_path_is_under_repo_root() -> None:
+	repo_root = disk_cache._repo_root()
+	cache_path = disk_cache._default_cache_path()
+	assert os.path.isabs(cache_path)
+	assert os.path.isfile(os.path.join(repo_root, "disk_cache.py"))
+	assert cache_path == os.path.join(repo_root, "output", "lookup_cache.sqlite3")
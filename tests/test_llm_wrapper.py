@@ -18,6 +18,13 @@ def test_extract_xml_tag_returns_empty_when_missing() -> None:
 	assert llm_wrapper.extract_xml_tag("no tags here", "response") == ""
 
 
+#============================================
+def test_extract_xml_tags_reads_several_tags_in_one_pass() -> None:
+	raw = "<WINNER>A</WINNER> <reason>first</reason> <reason>second</reason> <note>open"
+	tags = llm_wrapper.extract_xml_tags(raw, ["winner", "reason", "note", "missing"])
+	assert tags == {"winner": "A", "reason": "second", "note": "open"}
+
+
 #============================================
 def test_extract_response_text_accepts_trailing_missing_close() -> None:
 	raw = "prefix <response>Hello there"
@@ -28,3 +35,54 @@ def test_extract_response_text_accepts_trailing_missing_close() -> None:
 def test_extract_response_text_returns_empty_when_missing() -> None:
 	assert llm_wrapper.extract_response_text("") == ""
 
+
+#============================================
+def test_warm_up_model_loads_each_model_once(monkeypatch) -> None:
+	calls = []
+	monkeypatch.setattr(llm_wrapper, "_WARMED_MODELS", set())
+	monkeypatch.setattr(llm_wrapper, "ollama_api_available", lambda: False)
+	monkeypatch.setattr(llm_wrapper.subprocess, "run", lambda command, **kwargs: calls.append(command))
+	llm_wrapper.warm_up_model("tiny-model", backend="ollama")
+	llm_wrapper.warm_up_model("tiny-model", backend="ollama")
+	assert calls == [["ollama", "run", "tiny-model"]]
+
+
+#============================================
+def test_query_ollama_model_uses_http_api(monkeypatch) -> None:
+	class FakeResponse:
+		def raise_for_status(self) -> None:
+			return None
+
+		def json(self) -> dict:
+			return {"response": " <response>Hi</response> "}
+
+	posts = []
+
+	def fake_post(url, json=None, timeout=None):
+		posts.append((url, json))
+		return FakeResponse()
+
+	monkeypatch.setattr(llm_wrapper, "_ollama_api_up", True)
+	monkeypatch.setattr(llm_wrapper._OLLAMA_SESSION, "post", fake_post)
+	monkeypatch.setattr(llm_wrapper.subprocess, "run", lambda *args, **kwargs: None)
+	assert llm_wrapper.query_ollama_model("hello", "tiny-model") == "<response>Hi</response>"
+	url, payload = posts[0]
+	assert url.endswith("/api/generate")
+	assert payload["model"] == "tiny-model"
+	assert payload["keep_alive"] == llm_wrapper.OLLAMA_KEEP_ALIVE
+	assert payload["stream"] is False
+
+
+#============================================
+def test_query_ollama_model_falls_back_to_cli_on_http_error(monkeypatch) -> None:
+	def failing_post(url, json=None, timeout=None):
+		raise llm_wrapper.requests.ConnectionError("daemon gone")
+
+	def fake_run(command, **kwargs):
+		return llm_wrapper.subprocess.CompletedProcess(command, 0, stdout="from cli\n", stderr="")
+
+	monkeypatch.setattr(llm_wrapper, "_ollama_api_up", True)
+	monkeypatch.setattr(llm_wrapper._OLLAMA_SESSION, "post", failing_post)
+	monkeypatch.setattr(llm_wrapper.subprocess, "run", fake_run)
+	assert llm_wrapper.query_ollama_model("hello", "tiny-model") == "from cli"
+	assert llm_wrapper._ollama_api_up is None
@@ -0,0 +1,31 @@
+# Local repo modules
+import next_song_selector
+from audio_utils import Song
+
+
+#============================================
+def test_build_candidate_songs_excludes_current_when_sample_covers_library(tmp_path) -> None:
+	paths = [str(tmp_path / name) for name in ("a.mp3", "b.mp3", "current.mp3")]
+	current = Song(paths[2])
+	current.artist = "Current Artist"
+	candidates = next_song_selector.build_candidate_songs(current, paths, 5)
+	assert sorted(song.path for song in candidates) == paths[:2]
+
+
+#============================================
+def test_choose_two_next_songs_parses_both_picks(monkeypatch, tmp_path) -> None:
+	paths = [str(tmp_path / name) for name in ("alpha.mp3", "beta.mp3", "current.mp3")]
+	current = Song(paths[2])
+	candidates = [Song(paths[0]), Song(paths[1])]
+	reply = (
+		"<pick_a>alpha.mp3</pick_a><reason_a>Alpha keeps the same mellow groove and tempo going.</reason_a>"
+		"<pick_b>beta.mp3</pick_b><reason_b>Beta lifts the energy a little with brighter guitars.</reason_b>"
+	)
+	prompts = []
+	monkeypatch.setattr(next_song_selector.llm_wrapper, "run_llm", lambda prompt, model_name=None: prompts.append(prompt) or reply)
+	first, second = next_song_selector.choose_two_next_songs(current, paths, 2, candidates=candidates)
+	assert len(prompts) == 1
+	assert "<pick_a>" in prompts[0]
+	assert first.song is candidates[0]
+	assert second.song is candidates[1]
+	assert first.reason.startswith("Alpha keeps")
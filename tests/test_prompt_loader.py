@@ -0,0 +1,15 @@
+# Local repo modules
+import prompt_loader
+
+
+#============================================
+def test_render_prompt_fills_tokens_in_one_pass() -> None:
+	template = "A {{first}} B {{second}} C {{missing}} {{first}}"
+	values = {"first": "{{second}}", "second": None}
+	rendered = prompt_loader.render_prompt(template, values)
+	assert rendered == "A {{second}} B  C {{missing}} {{second}}"
+
+
+#============================================
+def test_render_prompt_handles_empty_template() -> None:
+	assert prompt_loader.render_prompt("", {"first": "x"}) == ""
@@ -1,5 +1,10 @@
 from types import SimpleNamespace
 
+import pytest
+
+# song_details_to_dj_intro reaches audio_wav through transcribe_audio, which requires numpy
+pytest.importorskip("numpy")
+
 import song_details_to_dj_intro
 
 
@@ -126,3 +131,61 @@ def test_build_relaxed_intro_appends_title() -> None:
 	result = song_details_to_dj_intro._build_relaxed_intro(raw, song)
 	assert result is not None
 	assert "Magic" in result
+
+
+#============================================
+def test_fetch_song_details_reuses_cached_text(monkeypatch, tmp_path) -> None:
+	import disk_cache
+	import audio_file_to_details
+	monkeypatch.setattr(disk_cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+	monkeypatch.setattr(disk_cache, "_CONNECTION", None)
+	calls = []
+
+	class FakeMetadata:
+		def __init__(self, path: str) -> None:
+			calls.append(path)
+
+		def fetch_wikipedia_info(self) -> None:
+			return None
+
+		def get_results(self) -> str:
+			return "Artist: Queen"
+
+		def has_summary(self) -> bool:
+			return True
+
+	monkeypatch.setattr(audio_file_to_details, "Metadata", FakeMetadata)
+	song = SimpleNamespace(path="/music/song.mp3", basename="song.mp3", artist="Queen", title="Song", album="Album")
+	assert song_details_to_dj_intro.fetch_song_details(song) == "Artist: Queen"
+	assert song_details_to_dj_intro.fetch_song_details(song) == "Artist: Queen"
+	assert calls == ["/music/song.mp3"]
+
+
+#============================================
+def test_fetch_song_details_skips_caching_failed_lookups(monkeypatch, tmp_path) -> None:
+	import disk_cache
+	import audio_file_to_details
+	monkeypatch.setattr(disk_cache, "CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+	monkeypatch.setattr(disk_cache, "_CONNECTION", None)
+	calls = []
+
+	class OutageMetadata:
+		def __init__(self, path: str) -> None:
+			calls.append(path)
+
+		def fetch_wikipedia_info(self) -> None:
+			return None
+
+		def get_results(self) -> str:
+			return "No relevant Wikipedia pages found."
+
+		def has_summary(self) -> bool:
+			return False
+
+	monkeypatch.setattr(audio_file_to_details, "Metadata", OutageMetadata)
+	untagged = SimpleNamespace(
+		path="/music/a/track.mp3", basename="track.mp3", artist="Unknown Artist", title="track", album="Unknown Album",
+	)
+	song_details_to_dj_intro.fetch_song_details(untagged)
+	song_details_to_dj_intro.fetch_song_details(untagged)
+	assert calls == ["/music/a/track.mp3", "/music/a/track.mp3"]
@@ -2,6 +2,8 @@ import pytest
 
 pytest.importorskip("pygame")
 pytest.importorskip("gtts")
+# tts_helpers shares the audio_wav mixer setup, which requires numpy
+pytest.importorskip("numpy")
 
 import tts_helpers
 
@@ -56,3 +58,72 @@ def test_format_intro_for_tts_filters_fact_lines() -> None:
 	assert "FACT:" not in normalized
 	assert "Ladies and gentlemen" not in normalized
 	assert "Hello there." in normalized
+
+
+#============================================
+def test_synthesize_dj_intro_uses_separate_files(monkeypatch) -> None:
+	def fake_say(text: str, speed: float) -> str:
+		path = tts_helpers._temp_audio_path(".aiff")
+		with open(path, "wb") as handle:
+			handle.write(b"raw")
+		return path
+
+	def fake_sox(input_file: str, speed: float, output_file: str | None = None) -> str:
+		with open(output_file, "wb") as handle:
+			handle.write(b"wav")
+		tts_helpers.os.remove(input_file)
+		return output_file
+
+	monkeypatch.setattr(tts_helpers, "text_to_speech_say", fake_say)
+	monkeypatch.setattr(tts_helpers, "process_audio_with_sox", fake_sox)
+	first = tts_helpers.synthesize_dj_intro("Hello there listeners.", 1.0, engine="say")
+	second = tts_helpers.synthesize_dj_intro("Another great song.", 1.0, engine="say")
+	assert first and second and first != second
+	for path in (first, second):
+		tts_helpers.os.remove(path)
+
+
+#============================================
+def test_speak_stream_plays_chunks_in_order(monkeypatch) -> None:
+	rendered = []
+	played = []
+
+	def fake_render(text: str, speed: float, engine_name: str, output_path: str | None = None) -> str:
+		rendered.append(text)
+		return f"/tmp/{len(rendered)}.wav"
+
+	monkeypatch.setattr(tts_helpers, "_render_speech", fake_render)
+	monkeypatch.setattr(tts_helpers, "play_dj_intro", lambda path, text: played.append((path, text)))
+	chunks = tts_helpers._split_for_streaming("First line here. Second line.\nThird line")
+	assert chunks == ["First line here.", "Second line.\nThird line"]
+	tts_helpers.speak_stream(iter(chunks + [" "]), 1.0, engine="say")
+	assert rendered == chunks
+	assert played == [("/tmp/1.wav", chunks[0]), ("/tmp/2.wav", chunks[1])]
+
+
+#============================================
+def test_render_speech_removes_temp_files_on_failure(monkeypatch, tmp_path) -> None:
+	monkeypatch.setattr(tts_helpers.tempfile, "tempdir", str(tmp_path))
+
+	def failing_run(command, check: bool) -> None:
+		raise tts_helpers.subprocess.CalledProcessError(1, command)
+
+	monkeypatch.setattr(tts_helpers.subprocess, "run", failing_run)
+	with pytest.raises(tts_helpers.subprocess.CalledProcessError):
+		tts_helpers._render_speech("Hello there.", 1.0, "say")
+	assert list(tmp_path.iterdir()) == []
+
+	def fake_say(text: str, speed: float) -> str:
+		path = tts_helpers._temp_audio_path(".aiff")
+		with open(path, "wb") as handle:
+			handle.write(b"raw")
+		return path
+
+	def silent_sox(input_file: str, speed: float, output_file: str | None = None) -> str:
+		tts_helpers.os.remove(input_file)
+		return output_file
+
+	monkeypatch.setattr(tts_helpers, "text_to_speech_say", fake_say)
+	monkeypatch.setattr(tts_helpers, "process_audio_with_sox", silent_sox)
+	assert tts_helpers._render_speech("Hello there.", 1.0, "say") is None
+	assert list(tmp_path.iterdir()) == []
@@ -117,21 +117,20 @@ def transcribe_audio(
 		"--print-colors",
 		wav_name,
 	]
-	whisper_result = subprocess.run(
-		whisper_cmd,
-		capture_output=True,
-		text=True,
-		errors="replace",
-		env=env,
-		cwd=temp_dir,
-	)
+	try:
+		whisper_result = subprocess.run(
+			whisper_cmd,
+			capture_output=True,
+			text=True,
+			errors="replace",
+			env=env,
+			cwd=temp_dir,
+		)
+	finally:
+		audio_wav.release_wav(audio_wav_path)
 	if whisper_result.returncode != 0:
 		error_text = whisper_result.stderr.strip() or whisper_result.stdout.strip()
 		print(f"{Colors.FAIL}Whisper transcription failed: {escape(error_text)}{Colors.ENDC}")
-		try:
-			os.unlink(audio_wav_path)
-		except OSError:
-			pass
 		return None
 
 	stderr_text = whisper_result.stderr or ""
@@ -151,10 +150,7 @@ def transcribe_audio(
 			os.unlink(transcript_path)
 		except OSError:
 			pass
-	try:
-		os.unlink(audio_wav_path)
-	except OSError:
-		pass
+	# the decoded WAV belongs to the audio_wav cache, which removes it after release
 
 	if not transcript:
 		print(f"{Colors.LIGHT_ORANGE}No transcript produced for {escape(os.path.basename(audio_path))}.{Colors.ENDC}")
@@ -5,7 +5,9 @@ import re
 import time
 import random
 import subprocess
+import tempfile
 import warnings
+import concurrent.futures
 
 # PIP3 modules
 warnings.filterwarnings("ignore", category=UserWarning, module="pkg_resources")
@@ -15,18 +17,17 @@ try:
 except ImportError:
 	pyttsx3 = None
 from gtts import gTTS
-try:
-	from rich.console import Console
-	RICH_CONSOLE = Console()
-except ImportError:
-	Console = None
-	RICH_CONSOLE = None
 
 # Local repo modules
-from cli_colors import Colors
+import audio_wav
+from cli_colors import Colors, RICH_CONSOLE
 
 DEFAULT_ENGINE = "say"
 TTS_VOLUME_GAIN = 0.99
+# engines that keep one voice across calls, so an intro can be rendered in pieces;
+# pyttsx3 picks a random voice per render and must stay on the main thread
+STREAMING_ENGINES = ("say", "gtts")
+_FIRST_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
 
 #============================================
 def format_intro_for_tts(text: str) -> str:
@@ -109,10 +110,7 @@ def _strip_boilerplate_intro(text: str) -> str:
 #============================================
 def _print_say_command(command: list[str], text: str, show_text: bool = False) -> None:
 	command_prefix = " ".join(command[:-1] if command and text and command[-1] == text else command)
-	if RICH_CONSOLE:
-		RICH_CONSOLE.print(f"{Colors.WHITE}[say] running: {command_prefix}{Colors.ENDC}")
-	else:
-		print(f"[say] running: {command_prefix}")
+	RICH_CONSOLE.print(f"{Colors.WHITE}[say] running: {command_prefix}{Colors.ENDC}")
 
 #============================================
 def _insert_pacing_linebreaks(text: str) -> str:
@@ -163,35 +161,66 @@ def _comma_is_list_like(tail: str) -> bool:
 	return False
 
 #============================================
-def _ensure_mixer_initialized() -> None:
-	if not pygame.mixer.get_init():
-		pygame.mixer.init()
+def _temp_audio_path(suffix: str) -> str:
+	"""
+	Reserve a unique temporary audio file name for one TTS render.
+	"""
+	handle, path = tempfile.mkstemp(prefix="dj_tts_", suffix=suffix)
+	os.close(handle)
+	return path
+
+#============================================
+def _has_audio(path: str) -> bool:
+	# temp names are reserved up front, so an empty file means the render failed
+	return os.path.isfile(path) and os.path.getsize(path) > 0
+
+#============================================
+def _remove_if_exists(path: str) -> None:
+	# failed renders leave reserved dj_tts_* names behind in the temp dir
+	if path and os.path.exists(path):
+		os.remove(path)
+
+#============================================
+def warm_up() -> None:
+	"""
+	Open the shared pygame mixer before the first intro needs it.
+	pyttsx3 is not touched here: its macOS driver must be created on the main thread.
+	"""
+	audio_wav.ensure_mixer_initialized()
 
 #============================================
 def text_to_speech_pyttsx3(text: str, speed: float) -> str:
-	raw_wav = "temp_raw.wav"
-	engine = pyttsx3.init(driverName='nsss')
-	voices = engine.getProperty("voices")
-	english_voices = [voice.id for voice in voices if any(lang in voice.id for lang in ["en-", "en_", "en."])]
-	if not english_voices:
-		raise RuntimeError("[ERROR] No English voices found!")
-	selected_voice = random.choice(english_voices)
-	engine.setProperty("voice", selected_voice)
-	target_wpm = int(150 * speed)
-	engine.setProperty("rate", target_wpm)
-	engine.save_to_file(text, raw_wav)
-	engine.runAndWait()
-	if not os.path.exists(raw_wav):
-		raise FileNotFoundError(f"[ERROR] pyttsx3 failed to generate {raw_wav}")
+	raw_wav = _temp_audio_path(".wav")
+	try:
+		engine = pyttsx3.init(driverName='nsss')
+		voices = engine.getProperty("voices")
+		english_voices = [voice.id for voice in voices if any(lang in voice.id for lang in ["en-", "en_", "en."])]
+		if not english_voices:
+			raise RuntimeError("[ERROR] No English voices found!")
+		selected_voice = random.choice(english_voices)
+		engine.setProperty("voice", selected_voice)
+		target_wpm = int(150 * speed)
+		engine.setProperty("rate", target_wpm)
+		engine.save_to_file(text, raw_wav)
+		engine.runAndWait()
+		if not _has_audio(raw_wav):
+			raise FileNotFoundError(f"[ERROR] pyttsx3 failed to generate {raw_wav}")
+	except Exception:
+		_remove_if_exists(raw_wav)
+		raise
 	return raw_wav
 
 #============================================
 def text_to_speech_gtts(text: str) -> str:
-	raw_mp3 = "temp_raw.mp3"
-	tts = gTTS(text=text, lang="en", slow=False)
-	tts.save(raw_mp3)
-	if not os.path.exists(raw_mp3):
-		raise FileNotFoundError("[ERROR] gTTS failed to generate audio.")
+	raw_mp3 = _temp_audio_path(".mp3")
+	try:
+		tts = gTTS(text=text, lang="en", slow=False)
+		tts.save(raw_mp3)
+		if not _has_audio(raw_mp3):
+			raise FileNotFoundError("[ERROR] gTTS failed to generate audio.")
+	except Exception:
+		_remove_if_exists(raw_mp3)
+		raise
 	return raw_mp3
 
 #============================================
@@ -211,7 +240,7 @@ def process_audio_with_sox(input_file: str, speed: float, output_file: str | Non
 
 #============================================
 def speak_text(text: str, engine: str, save: bool, speed: float):
-	_ensure_mixer_initialized()
+	audio_wav.ensure_mixer_initialized()
 	if engine == "pyttsx3":
 		if pyttsx3 is None:
 			raise RuntimeError("pyttsx3 is not installed.")
@@ -248,50 +277,137 @@ def _play_audio_file(audio_path: str, text: str) -> None:
 		time.sleep(0.5)
 
 #============================================
-def render_dj_intro_audio(prompt: str, speed: float, engine: str | None, output_path: str) -> str | None:
-	if not prompt or len(prompt.strip()) < 1:
-		return None
-	engine_name = engine or DEFAULT_ENGINE
+def _clean_intro_for_speech(prompt: str) -> str:
 	clean_prompt = format_intro_for_tts(prompt)
 	clean_prompt = re.sub(r"^[^A-Za-z0-9]+", "", clean_prompt.strip())
-	clean_prompt = re.sub(r"[^A-Za-z0-9]+$", "", clean_prompt).strip()
-	if not clean_prompt:
-		return None
+	return re.sub(r"[^A-Za-z0-9]+$", "", clean_prompt).strip()
 
+#============================================
+def _render_speech(
+	text: str,
+	speed: float,
+	engine_name: str,
+	output_path: str | None = None,
+) -> str | None:
+	"""
+	Render already-cleaned text with one engine and tempo-adjust it with sox.
+	"""
 	if engine_name == "pyttsx3":
 		if pyttsx3 is None:
 			raise RuntimeError("pyttsx3 is not installed.")
-		raw_wav = text_to_speech_pyttsx3(clean_prompt, speed=speed)
+		raw_wav = text_to_speech_pyttsx3(text, speed=speed)
 	elif engine_name == "say":
-		raw_wav = text_to_speech_say(clean_prompt, speed=speed)
+		raw_wav = text_to_speech_say(text, speed=speed)
 	else:
-		raw_wav = text_to_speech_gtts(clean_prompt)
+		raw_wav = text_to_speech_gtts(text)
 
+	if output_path is None:
+		output_path = _temp_audio_path(".wav")
 	output_dir = os.path.dirname(output_path)
 	if output_dir:
 		os.makedirs(output_dir, exist_ok=True)
 
-	print(f"[tts] Pre-rendering intro audio via sox at {speed}x...")
-	final_audio = process_audio_with_sox(raw_wav, speed, output_file=output_path)
-	return final_audio if os.path.exists(final_audio) else None
+	print(f"[tts] Rendering intro audio via sox at {speed}x...")
+	try:
+		final_audio = process_audio_with_sox(raw_wav, speed, output_file=output_path)
+	except Exception:
+		_remove_if_exists(raw_wav)
+		_remove_if_exists(output_path)
+		raise
+	if _has_audio(final_audio):
+		return final_audio
+	_remove_if_exists(final_audio)
+	return None
+
+#============================================
+def synthesize_dj_intro(
+	prompt: str,
+	speed: float,
+	engine: str | None = None,
+	output_path: str | None = None,
+) -> str | None:
+	"""
+	Render an intro to a tempo-adjusted WAV without playing it.
+
+	Synthesis is the slow part of TTS, so callers can run it ahead of time
+	(for example while the previous song plays) and call play_dj_intro later.
+	Without output_path a unique temporary file is used, so concurrent renders
+	never share a file.
+
+	Returns:
+		str | None: Path to the rendered WAV, or None when there is nothing to say.
+	"""
+	if not prompt or len(prompt.strip()) < 1:
+		return None
+	engine_name = engine or DEFAULT_ENGINE
+	clean_prompt = _clean_intro_for_speech(prompt)
+	if not clean_prompt:
+		return None
+
+	return _render_speech(clean_prompt, speed, engine_name, output_path)
 
 #============================================
-def play_rendered_intro(audio_path: str, prompt: str) -> None:
+def play_dj_intro(audio_path: str, prompt: str) -> None:
+	"""
+	Play a rendered intro WAV to the end, then delete it.
+	"""
 	if not audio_path:
-		print("No cached intro audio to play; skipping.")
+		print("No intro audio to play; skipping.")
 		return
 	if not os.path.exists(audio_path):
-		print(f"Cached intro audio not found: {audio_path}")
+		print(f"Intro audio not found: {audio_path}")
 		return
-	_ensure_mixer_initialized()
-	print(f"[tts] Playing cached intro: {os.path.basename(audio_path)}")
+	audio_wav.ensure_mixer_initialized()
+	print(f"[tts] Playing intro: {os.path.basename(audio_path)}")
 	try:
 		_play_audio_file(audio_path, prompt)
 	except Exception as error:
 		print(f"TTS playback error: {error}")
 		return
-	if os.path.exists(audio_path):
-		os.remove(audio_path)
+	finally:
+		if os.path.exists(audio_path):
+			os.remove(audio_path)
+
+#============================================
+def _split_for_streaming(text: str) -> list[str]:
+	"""
+	Split cleaned intro text into its first sentence and the rest.
+	"""
+	return [part for part in _FIRST_SENTENCE_RE.split(text, maxsplit=1) if part.strip()]
+
+#============================================
+def _render_next_chunk(chunk_iter, speed: float, engine_name: str) -> tuple[str, str | None] | None:
+	"""
+	Pull the next text chunk and render it; None once the chunks run out.
+	"""
+	for chunk in chunk_iter:
+		chunk = chunk.strip() if chunk else ""
+		if not chunk:
+			continue
+		try:
+			return chunk, _render_speech(chunk, speed, engine_name)
+		except Exception as error:
+			print(f"TTS render error: {error}")
+			return chunk, None
+	return None
+
+#============================================
+def speak_stream(chunks, speed: float, engine: str | None = None) -> None:
+	"""
+	Speak text chunks in order, rendering the next chunk while the current one plays.
+	"""
+	engine_name = engine or DEFAULT_ENGINE
+	chunk_iter = iter(chunks)
+	with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+		future = executor.submit(_render_next_chunk, chunk_iter, speed, engine_name)
+		while True:
+			rendered = future.result()
+			if rendered is None:
+				break
+			future = executor.submit(_render_next_chunk, chunk_iter, speed, engine_name)
+			text, audio_path = rendered
+			if audio_path:
+				play_dj_intro(audio_path, text)
 
 #============================================
 def speak_dj_intro(prompt: str, speed: float, engine: str | None = None) -> None:
@@ -299,19 +415,23 @@ def speak_dj_intro(prompt: str, speed: float, engine: str | None = None) -> None
 		print("No intro text to speak; skipping TTS.")
 		return
 	engine_name = engine or DEFAULT_ENGINE
-	clean_prompt = format_intro_for_tts(prompt)
-	clean_prompt = re.sub(r"^[^A-Za-z0-9]+", "", clean_prompt.strip())
-	clean_prompt = re.sub(r"[^A-Za-z0-9]+$", "", clean_prompt).strip()
+	clean_prompt = _clean_intro_for_speech(prompt)
 	print(f"Speaking intro ({len(clean_prompt)} chars) at {speed}x speed...")
+	chunks = _split_for_streaming(clean_prompt)
+	if engine_name in STREAMING_ENGINES and len(chunks) > 1:
+		# start talking after the first sentence renders instead of the whole intro
+		speak_stream(chunks, speed, engine=engine_name)
+		return
 	try:
-		speak_text(clean_prompt, engine=engine_name, save=False, speed=speed)
+		audio_path = synthesize_dj_intro(prompt, speed, engine=engine)
 	except Exception as error:
 		print(f"TTS playback error: {error}")
 		return
-	while pygame.mixer.music.get_busy():
-		time.sleep(1)
+	play_dj_intro(audio_path, prompt)
+
+#============================================
 def text_to_speech_say(text: str, speed: float) -> str:
-	raw_aiff = "temp_say.aiff"
+	raw_aiff = _temp_audio_path(".aiff")
 	target_wpm = max(80, int(150 * speed))
 	command = [
 		"say",
@@ -324,10 +444,14 @@ def text_to_speech_say(text: str, speed: float) -> str:
 	_print_say_command(command, text)
 	try:
 		subprocess.run(command, check=True)
+		if not _has_audio(raw_aiff):
+			raise RuntimeError("say command did not produce an audio file.")
 	except FileNotFoundError as error:
+		_remove_if_exists(raw_aiff)
 		raise RuntimeError("say command not found on this system.") from error
-	if not os.path.exists(raw_aiff):
-		raise RuntimeError("say command did not produce an audio file.")
+	except Exception:
+		_remove_if_exists(raw_aiff)
+		raise
 	return raw_aiff
 
 #============================================